@@ -1,24 +1,53 @@
+from .startup import tracer, print_report
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Adw, Gtk, GObject
+from gi.repository import Adw, Gtk, GObject, GLib
 from gettext import gettext as _
+import importlib
 import sys
 from .window import HomeTheaterWindow, HomeTheaterPreferencesWindow
 from .item import HomeTheaterItem
-from .imdb import IMDb
-from .player import HomeTheaterPlayer
 from .episodes import EpisodesUI
 
+tracer.mark('imports')
+
+# Exports that pull in heavy dependencies (requests, bs4, GStreamer) are
+# only imported when they are first accessed
+_LAZY_EXPORTS = {
+    'IMDb': '.imdb',
+    'HomeTheaterPlayer': '.player',
+}
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def main(version):
     """The main entry point for the application."""
     app = Adw.Application(application_id='space.koyu.hometheater')
-    
+    app.add_main_option('startup-report', 0, GLib.OptionFlags.NONE,
+                        GLib.OptionArg.INT,
+                        _("Print startup timing percentiles over the last N launches"),
+                        "N")
+
+    def on_handle_local_options(app, options):
+        if options.contains('startup-report'):
+            print_report(options.lookup_value('startup-report').unpack())
+            return 0
+        return -1
+
     def on_activate(app):
+        tracer.mark('activate')
         win = HomeTheaterWindow(application=app)
         win.present()
-    
+
+    app.connect('handle-local-options', on_handle_local_options)
     app.connect('activate', on_activate)
     return app.run(sys.argv)
 
@@ -0,0 +1,72 @@
+# cancellation.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import threading
+
+
+class Cancelled(Exception):
+    """Raised by work that notices its token was cancelled"""
+
+
+class CancellationToken:
+    """Shared flag that stops a job and the requests it has in flight
+
+    Work checks the token between steps. Open HTTP responses register
+    with the token so cancel() can close them, which makes a read that
+    is blocked on the socket fail right away instead of running to its
+    timeout.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._closeables = set()
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        """Cancel the job, safe to call from any thread and more than once"""
+        self._event.set()
+        with self._lock:
+            closeables = list(self._closeables)
+            self._closeables.clear()
+        for closeable in closeables:
+            try:
+                closeable.close()
+            except Exception as e:
+                print(f"Error closing cancelled request: {e}")
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise Cancelled()
+
+    def register(self, closeable):
+        """Close closeable on cancel, or now if already cancelled"""
+        with self._lock:
+            if not self._event.is_set():
+                self._closeables.add(closeable)
+                return
+        closeable.close()
+        raise Cancelled()
+
+    def unregister(self, closeable):
+        with self._lock:
+            self._closeables.discard(closeable)
@@ -0,0 +1,79 @@
+# dispatcher.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import threading
+from gi.repository import GLib
+
+
+class MainLoopDispatcher:
+    """Marshals effects from worker threads onto the GTK main loop
+
+    call() queues a function to run on the main loop. Everything queued
+    within one frame is applied together in queue order by a single
+    timeout, instead of one idle source per call.
+
+    progress() is for status text and the like where only the latest
+    value matters: calls with the same key replace each other and are
+    flushed at most once per progress interval.
+    """
+
+    def __init__(self, batch_interval_ms=16, progress_interval_ms=250):
+        self.batch_interval_ms = batch_interval_ms
+        self.progress_interval_ms = progress_interval_ms
+        self._lock = threading.Lock()
+        self._queue = []
+        self._batch_source = None
+        self._progress = {}
+        self._progress_source = None
+
+    def call(self, func, *args):
+        """Run func(*args) on the main loop with the next batch"""
+        with self._lock:
+            self._queue.append((func, args))
+            if self._batch_source is None:
+                self._batch_source = GLib.timeout_add(self.batch_interval_ms, self._flush_batch)
+
+    def progress(self, key, func, *args):
+        """Run func(*args) on the main loop, dropping older calls for key"""
+        with self._lock:
+            self._progress[key] = (func, args)
+            if self._progress_source is None:
+                self._progress_source = GLib.timeout_add(self.progress_interval_ms, self._flush_progress)
+
+    def _flush_batch(self):
+        with self._lock:
+            queue, self._queue = self._queue, []
+            self._batch_source = None
+        self._run(queue)
+        return False
+
+    def _flush_progress(self):
+        with self._lock:
+            updates = list(self._progress.values())
+            self._progress.clear()
+            self._progress_source = None
+        self._run(updates)
+        return False
+
+    def _run(self, calls):
+        for func, args in calls:
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Error applying update on the main loop: {e}")
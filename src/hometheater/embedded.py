@@ -0,0 +1,412 @@
+# embedded.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Titles, episode numbers and cover art stored inside MP4 and Matroska
+# files. Only box and element headers are read and the parsers seek over
+# media data, so a file costs a handful of small reads no matter its size.
+import os
+import json
+import struct
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional
+
+CACHE_VERSION = 1
+
+# Largest cover image that is extracted
+MAX_COVER_SIZE = 16 * 1024 * 1024
+# Largest title, tag or file name that is read
+MAX_STRING_SIZE = 64 * 1024
+
+# Matroska element ids
+EBML_HEADER = 0x1A45DFA3
+SEGMENT = 0x18538067
+SEEK_HEAD = 0x114D9B74
+SEEK = 0x4DBB
+SEEK_ID = 0x53AB
+SEEK_POSITION = 0x53AC
+INFO = 0x1549A966
+INFO_TITLE = 0x7BA9
+TAGS = 0x1254C367
+TAG = 0x7373
+SIMPLE_TAG = 0x67C8
+TAG_NAME = 0x45A3
+TAG_STRING = 0x4487
+ATTACHMENTS = 0x1941A469
+ATTACHED_FILE = 0x61A7
+FILE_NAME = 0x466E
+FILE_MIME_TYPE = 0x4660
+FILE_DATA = 0x465C
+CLUSTER = 0x1F43B675
+
+
+def _read_vint(f, keep_marker=False):
+    """Read an EBML variable size integer, returns (value, length) or None"""
+    first = f.read(1)
+    if not first:
+        return None
+    byte = first[0]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not byte & mask:
+        length += 1
+        mask >>= 1
+    if length > 8:
+        return None
+    value = byte if keep_marker else byte & (mask - 1)
+    rest = f.read(length - 1)
+    if len(rest) != length - 1:
+        return None
+    for b in rest:
+        value = (value << 8) | b
+    # All ones in the value bits means unknown size
+    if not keep_marker and value == (1 << (7 * length)) - 1:
+        value = -1
+    return value, length
+
+
+def _read_element(f):
+    """Read an element header, returns (id, data size) or None"""
+    element_id = _read_vint(f, keep_marker=True)
+    size = _read_vint(f)
+    if element_id is None or size is None:
+        return None
+    return element_id[0], size[0]
+
+
+def _children(f, end):
+    """Yield (id, size, data offset) for the elements up to end
+
+    Stops at an element that claims to reach past end, the file is
+    corrupt from there on.
+    """
+    while f.tell() < end:
+        header = _read_element(f)
+        if header is None:
+            return
+        element_id, size = header
+        offset = f.tell()
+        if size < 0 or offset + size > end:
+            return
+        yield element_id, size, offset
+        f.seek(offset + size)
+
+
+def _parse_matroska(f, file_size):
+    info = {}
+    header = _read_element(f)
+    if header is None or header[0] != EBML_HEADER:
+        return None
+    f.seek(f.tell() + header[1])
+
+    header = _read_element(f)
+    if header is None or header[0] != SEGMENT:
+        return None
+    segment_start = f.tell()
+    segment_end = file_size if header[1] < 0 else min(segment_start + header[1], file_size)
+
+    # Use the seek head to jump straight to Info, Tags and Attachments,
+    # otherwise walk the top level elements up to the first cluster
+    positions = {}
+    for element_id, size, offset in _children(f, segment_end):
+        if element_id == SEEK_HEAD:
+            for seek_id, seek_size, seek_offset in _children(f, offset + size):
+                if seek_id != SEEK:
+                    continue
+                target = position = None
+                for child_id, child_size, child_offset in _children(f, seek_offset + seek_size):
+                    if child_size > 8:
+                        continue
+                    data = f.read(child_size)
+                    if child_id == SEEK_ID:
+                        target = int.from_bytes(data, 'big')
+                    elif child_id == SEEK_POSITION:
+                        position = int.from_bytes(data, 'big')
+                if target in (INFO, TAGS, ATTACHMENTS) and position is not None:
+                    positions.setdefault(target, segment_start + position)
+        elif element_id in (INFO, TAGS, ATTACHMENTS):
+            positions[element_id] = ('inline', offset, size)
+        elif element_id == CLUSTER:
+            break
+
+    for element_id in (INFO, TAGS, ATTACHMENTS):
+        position = positions.get(element_id)
+        if position is None:
+            continue
+        if isinstance(position, tuple):
+            _, offset, size = position
+        else:
+            f.seek(position)
+            header = _read_element(f)
+            if header is None or header[0] != element_id or header[1] < 0 or \
+               f.tell() + header[1] > segment_end:
+                continue
+            offset, size = f.tell(), header[1]
+        f.seek(offset)
+        end = offset + size
+
+        if element_id == INFO:
+            for child_id, child_size, child_offset in _children(f, end):
+                if child_id == INFO_TITLE and child_size <= MAX_STRING_SIZE:
+                    info['title'] = f.read(child_size).decode('utf-8', 'replace').strip()
+        elif element_id == TAGS:
+            _parse_matroska_tags(f, end, info)
+        else:
+            _parse_matroska_attachments(f, end, info)
+
+    return info
+
+
+def _parse_matroska_tags(f, end, info):
+    for tag_id, tag_size, tag_offset in _children(f, end):
+        if tag_id != TAG:
+            continue
+        for simple_id, simple_size, simple_offset in _children(f, tag_offset + tag_size):
+            if simple_id != SIMPLE_TAG:
+                continue
+            name = value = None
+            for child_id, child_size, child_offset in _children(f, simple_offset + simple_size):
+                if child_size > MAX_STRING_SIZE:
+                    continue
+                if child_id == TAG_NAME:
+                    name = f.read(child_size).decode('utf-8', 'replace').upper()
+                elif child_id == TAG_STRING:
+                    value = f.read(child_size).decode('utf-8', 'replace').strip()
+            if not name or not value:
+                continue
+            if name == 'TITLE':
+                info.setdefault('tag_title', value)
+            elif name in ('DATE_RELEASED', 'DATE_RECORDED') and value[:4].isdigit():
+                info.setdefault('year', value[:4])
+            elif name == 'PART_NUMBER' and value.isdigit():
+                info.setdefault('episode', int(value))
+
+
+def _parse_matroska_attachments(f, end, info):
+    for file_id, file_size, file_offset in _children(f, end):
+        if file_id != ATTACHED_FILE:
+            continue
+        name = mime = None
+        data_offset = data_size = None
+        for child_id, child_size, child_offset in _children(f, file_offset + file_size):
+            if child_id in (FILE_NAME, FILE_MIME_TYPE) and child_size > MAX_STRING_SIZE:
+                continue
+            if child_id == FILE_NAME:
+                name = f.read(child_size).decode('utf-8', 'replace').lower()
+            elif child_id == FILE_MIME_TYPE:
+                mime = f.read(child_size).decode('ascii', 'replace')
+            elif child_id == FILE_DATA:
+                data_offset, data_size = child_offset, child_size
+        # Matroska names cover art cover.jpg/cover.png by convention
+        if (mime or '').startswith('image/') and data_offset is not None and \
+           data_size <= MAX_COVER_SIZE and (name or '').startswith('cover'):
+            f.seek(data_offset)
+            info['cover'] = f.read(data_size)
+            info['cover_type'] = 'png' if mime == 'image/png' else 'jpg'
+            return
+
+
+def _boxes(f, end):
+    """Yield (type, size of data, data offset) for the MP4 boxes up to end"""
+    while f.tell() + 8 <= end:
+        start = f.tell()
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, box_type = struct.unpack('>I4s', header)
+        header_size = 8
+        if size == 1:
+            extended = f.read(8)
+            if len(extended) < 8:
+                return
+            size = struct.unpack('>Q', extended)[0]
+            header_size = 16
+        elif size == 0:
+            size = end - start
+        if size < header_size or start + size > end:
+            return
+        yield box_type, size - header_size, start + header_size
+        f.seek(start + size)
+
+
+def _find_box(f, end, path):
+    """Descend into nested boxes, returns (data offset, size) or None"""
+    for box_type, size, offset in _boxes(f, end):
+        if box_type != path[0]:
+            continue
+        if box_type == b'meta':
+            # meta is a full box, skip version and flags
+            offset += 4
+            size -= 4
+        if len(path) == 1:
+            return offset, size
+        f.seek(offset)
+        return _find_box(f, offset + size, path[1:])
+    return None
+
+
+def _parse_mp4(f, file_size):
+    info = {}
+    found = _find_box(f, file_size, [b'moov', b'udta', b'meta', b'ilst'])
+    if found is None:
+        return info
+    offset, size = found
+    f.seek(offset)
+
+    for item_type, item_size, item_offset in _boxes(f, offset + size):
+        f.seek(item_offset)
+        data = _find_box(f, item_offset + item_size, [b'data'])
+        if data is None:
+            continue
+        data_offset, data_size = data
+        if data_size < 8:
+            continue
+        f.seek(data_offset)
+        data_type = struct.unpack('>I', f.read(4))[0] & 0xFFFFFF
+        f.read(4)  # locale
+        length = data_size - 8
+
+        if item_type == b'covr':
+            if length <= MAX_COVER_SIZE and 'cover' not in info:
+                info['cover'] = f.read(length)
+                info['cover_type'] = 'png' if data_type == 14 else 'jpg'
+            continue
+        if length > MAX_STRING_SIZE:
+            continue
+        value = f.read(length)
+        if item_type == b'\xa9nam':
+            info['title'] = value.decode('utf-8', 'replace').strip()
+        elif item_type == b'\xa9day' and value[:4].isdigit():
+            info['year'] = value[:4].decode()
+        elif item_type == b'tvsh':
+            info['show'] = value.decode('utf-8', 'replace').strip()
+        elif item_type in (b'tvsn', b'tves') and value:
+            number = int.from_bytes(value, 'big')
+            info['season' if item_type == b'tvsn' else 'episode'] = number
+    return info
+
+
+def read_embedded(path) -> Dict:
+    """Return the tags and cover found in an MP4 or Matroska file
+
+    The dict may contain title, year, show, season, episode and cover
+    (raw image bytes) with cover_type. Other containers give an empty dict.
+    """
+    suffix = Path(path).suffix.lower()
+    try:
+        file_size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            if suffix in ('.mkv', '.webm'):
+                info = _parse_matroska(f, file_size) or {}
+                # An Info title is often just the release name, prefer tags
+                if info.get('tag_title'):
+                    info['title'] = info.pop('tag_title')
+                info.pop('tag_title', None)
+                return info
+            if suffix in ('.mp4', '.m4v', '.mov'):
+                return _parse_mp4(f, file_size)
+    except (OSError, struct.error, ValueError) as e:
+        print(f"Error reading embedded tags of {path}: {e}")
+    return {}
+
+
+class EmbeddedTagCache:
+    """Embedded tags per file, so each file is only read once
+
+    Entries are keyed by path and reused while the file's size and
+    modification time stay the same. Cover images are written to the
+    covers directory and referenced by path.
+    """
+
+    def __init__(self, path: Path, covers_dir: Path):
+        self.path = Path(path)
+        self.covers_dir = Path(covers_dir)
+        self.entries = {}
+        self._dirty = False
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get('version') == CACHE_VERSION:
+            self.entries = data.get('entries', {})
+
+    def save(self):
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': CACHE_VERSION, 'entries': self.entries}, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            print(f"Error saving embedded tag cache: {e}")
+
+    def get(self, path: str) -> Optional[Dict]:
+        """Return the tags of a file, reading it only if it changed"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        entry = self.entries.get(path)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            return entry['tags']
+        if entry:
+            self._remove_cover(entry)
+
+        tags = read_embedded(path)
+        cover = tags.pop('cover', None)
+        cover_type = tags.pop('cover_type', 'jpg')
+        if cover:
+            name = hashlib.sha1(path.encode()).hexdigest()[:16]
+            cover_path = self.covers_dir / f"{name}.{cover_type}"
+            try:
+                self.covers_dir.mkdir(parents=True, exist_ok=True)
+                cover_path.write_bytes(cover)
+                tags['cover'] = str(cover_path)
+            except OSError as e:
+                print(f"Error saving cover of {path}: {e}")
+
+        self.entries[path] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'tags': tags}
+        self._dirty = True
+        return tags
+
+    def _remove_cover(self, entry):
+        cover = entry['tags'].get('cover')
+        if cover:
+            try:
+                os.unlink(cover)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Error removing cover {cover}: {e}")
+
+    def prune(self, paths):
+        """Forget files that are gone, along with their extracted covers"""
+        paths = set(paths)
+        stale = [path for path in self.entries if path not in paths]
+        for path in stale:
+            self._remove_cover(self.entries.pop(path))
+        if stale:
+            self._dirty = True
@@ -3,19 +3,197 @@ import re
 import html
 import json
 import os
+import threading
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, Pango, GdkPixbuf, Gdk
+from gi.repository import Gtk, Adw, Pango, GdkPixbuf, Gdk, Gio, GLib, GObject
 from pathlib import Path
 import subprocess
 
+from .library import release_info
+from .releasename import episode_number
+
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Loaded once per display by _ensure_css(), scoped to the episodes view
+CSS = """
+.episodes-view .episode-number {
+    min-width: 32px;
+    min-height: 32px;
+    padding: 0;
+    margin: 8px;
+    font-size: 14px;
+    font-weight: bold;
+    /* Use halign instead of text-align */
+    halign: center;
+    background: alpha(@accent_color, 0.15);
+    color: @accent_color;
+    border-radius: 50%;
+}
+
+.episodes-view .episode-number:disabled {
+    opacity: 1.0;
+}
+
+.episodes-view .episode-list row {
+    padding: 12px;
+    margin: 2px;
+}
+
+.episodes-view .episode-list row > box {
+    margin-start: 12px;
+    margin-end: 12px;
+}
+
+.episodes-view .rounded-corners {
+    border-radius: 12px;
+}
+
+.episodes-view .episode-row {
+    transition: background-color 200ms ease;
+    padding: 0;  /* Remove padding from row */
+    margin: 2px;
+    border-radius: 12px;
+    overflow: hidden;
+}
+
+.episodes-view .episode-content {
+    padding: 12px;  /* Add padding to content box instead */
+}
+
+.episodes-view .episode-progress {
+    min-height: 3px;
+    background-color: @accent_color;
+    margin: 0;
+    padding: 0;
+}
+
+.episodes-view .episode-progress trough {
+    min-height: 3px;
+    background-color: alpha(@accent_color, 0.1);
+    border: none;
+    border-radius: 0;
+    margin: 0;
+    padding: 0;
+}
+
+.episodes-view .episode-progress progress {
+    min-height: 3px;
+    background-color: @accent_color;
+    border-radius: 0;
+    margin: 0;
+    padding: 0;
+}
+
+.episodes-view .circular {
+    padding: 8px;
+    min-width: 36px;
+    min-height: 36px;
+    margin: 4px;
+    border-radius: 9999px;
+}
+
+.episodes-view .episode-list progressbar {
+    margin: 0;
+    padding: 0;
+    min-height: 3px;
+}
+
+.episodes-view .episode-list progressbar.episode-progress {
+    margin-top: -12px;  /* Negative margin to position at top */
+    margin-bottom: 12px;
+    margin-start: -12px;
+    margin-end: -12px;
+}
+
+.episodes-view .episode-list progressbar > trough {
+    min-height: 3px;
+    border: none;
+    background-color: transparent;
+}
+
+.episodes-view .episode-list progressbar > trough > progress {
+    min-height: 3px;
+    background-color: @accent_color;
+    border-radius: 0;
+}
+
+.episodes-view .episode-progress-container {
+    padding: 0;
+    margin: 0;
+}
+
+.episodes-view .episode-overlay {
+    margin: 0;
+    padding: 0;
+    border-radius: 12px; /* Match the row's rounded corners */
+    overflow: hidden;    /* Ensure the progress bar stays within bounds */
+}
+
+.episodes-view .episode-progress {
+    min-height: 4px;
+    margin: 0;
+    padding: 0;
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+}
+
+.episodes-view .episode-progress > trough {
+    min-height: 4px;
+    background-color: alpha(@accent_color, 0.1);
+    border: none;
+}
+
+.episodes-view .episode-progress > trough > progress {
+    min-height: 4px;
+    background-color: @accent_color;
+    border-radius: 0;
+}
+
+.episodes-view .episode-overlay {
+    border-radius: 12px;
+    overflow: hidden;
+}
+"""
+
+_css_displays = set()
+
+
+def _ensure_css(display):
+    """Install the episodes stylesheet on a display the first time it is needed"""
+    if display is None or display in _css_displays:
+        return
+    css_provider = Gtk.CssProvider()
+    css_provider.load_from_data(CSS.encode(), -1)
+    Gtk.StyleContext.add_provider_for_display(
+        display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+    _css_displays.add(display)
+
+
+class EpisodeRow(GObject.Object):
+    """Precomputed contents of one row in the episode list"""
+    __gtype_name__ = 'EpisodeRow'
+
+    number = GObject.Property(type=int, default=-1)
+    title = GObject.Property(type=str, default='')
+    subtitle = GObject.Property(type=str, default='')
+    progress = GObject.Property(type=float, default=0.0)
+
+    def __init__(self, episode, **kwargs):
+        super().__init__(**kwargs)
+        self.episode = episode
+        self.path = episode['path']
+
+
 @Gtk.Template(resource_path='/space/koyu/hometheater/episodes.ui')
 class EpisodesUI(Gtk.Box):
     __gtype_name__ = 'EpisodesUI'
 
     # Add template children
     season_selector = Gtk.Template.Child()
-    episodes_box = Gtk.Template.Child()
+    episodes_list = Gtk.Template.Child()
     poster_container = Gtk.Template.Child()
     show_title = Gtk.Template.Child()
     show_year = Gtk.Template.Child()
@@ -30,12 +208,76 @@ class EpisodesUI(Gtk.Box):
         self.show_name = show_name
         self.seasons = seasons
         
+        self._fill_show_info()
+
+        # Create string list model for seasons
+        season_keys = sorted(seasons.keys(), key=int)
+        season_strings = [f"Season {season}" for season in season_keys]
+        string_list = Gtk.StringList.new(season_strings)
+        
+        # Setup dropdown with model
+        self.season_selector.set_model(string_list)
+        self.season_selector.set_selected(0)  # Select first season
+        self.season_selector.connect('notify::selected', self.on_season_changed)
+
+        # Rows are only built for what is visible and reused on scroll,
+        # each season keeps its model so switching back is free
+        self._season_models = {}
+        self._durations = {}
+        self.selection = Gtk.NoSelection()
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_row_setup)
+        factory.connect('bind', self._on_row_bind)
+        factory.connect('unbind', self._on_row_unbind)
+        self.episodes_list.set_model(self.selection)
+        self.episodes_list.set_factory(factory)
+
+        # Apply CSS styling
+        self.add_css_class('episodes-view')
+        _ensure_css(Gdk.Display.get_default())
+        
+        # Show first season
+        self.populate_season(season_keys[0])
+
+        # Follow metadata changes while the page is shown
+        self._metadata_handler = None
+        self.connect('realize', self._on_realize)
+        self.connect('unrealize', self._on_unrealize)
+
+    def _on_realize(self, widget):
+        self._metadata_handler = self.parent_window.connect(
+            'metadata-changed', self._on_metadata_changed)
+
+    def _on_unrealize(self, widget):
+        if self._metadata_handler:
+            self.parent_window.disconnect(self._metadata_handler)
+            self._metadata_handler = None
+
+    def _on_metadata_changed(self, window, key):
+        """Re-render only the header or the episode row that changed"""
+        if key == f"show:{self.show_name}":
+            self._fill_show_info()
+            return
+
+        for model in self._season_models.values():
+            for i in range(model.get_n_items()):
+                row = model.get_item(i)
+                if row.path == key:
+                    ep_num = row.props.number if row.props.number >= 0 else None
+                    metadata = self.parent_window.get_episode_metadata(key)
+                    title, subtitle = self._describe_episode(ep_num, row.episode, metadata)
+                    row.props.title = title
+                    row.props.subtitle = subtitle
+                    return
+
+    def _fill_show_info(self):
+        """Fill (or refill) the show header from the show metadata"""
         # Load show metadata
-        show_key = f"show:{show_name}"
+        show_key = f"show:{self.show_name}"
         show_metadata = self.parent_window.metadata.get(show_key, {})
         
         # Update show info with safe HTML unescaping
-        title = show_metadata.get('title') or show_name
+        title = show_metadata.get('title') or self.show_name
         self.show_title.set_label(html.unescape(str(title)))
         
         # Handle other metadata safely
@@ -49,7 +291,7 @@ class EpisodesUI(Gtk.Box):
         plot = show_metadata.get('plot', '')
         if plot:
             # Remove HTML tags and unescape
-            plot = re.sub(r'<[^>]+>', '', str(plot))
+            plot = HTML_TAG_RE.sub('', str(plot))
             plot = html.unescape(plot)
         self.show_plot.set_label(plot)
         
@@ -57,6 +299,7 @@ class EpisodesUI(Gtk.Box):
         rating = show_metadata.get('rating')
         if rating and str(rating).lower() != 'none':
             self.show_rating.set_label(f"★ {rating}")
+            self.show_rating.set_visible(True)
         else:
             self.show_rating.set_visible(False)
         
@@ -67,10 +310,13 @@ class EpisodesUI(Gtk.Box):
             if len(cast) > 5:
                 cast_text += f" and {len(cast) - 5} more"
             self.show_cast.set_label(cast_text)
+            self.show_cast.set_visible(True)
         else:
             self.show_cast.set_visible(False)
         
         # Load show poster
+        while (child := self.poster_container.get_first_child()):
+            self.poster_container.remove(child)
         poster_path = show_metadata.get('poster')
         if poster_path and Path(poster_path).exists():
             try:
@@ -83,184 +329,57 @@ class EpisodesUI(Gtk.Box):
             except Exception as e:
                 print(f"Error loading show poster: {e}")
         
-        # Create string list model for seasons
-        season_strings = [f"Season {season}" for season in sorted(seasons.keys(), key=int)]
-        string_list = Gtk.StringList.new(season_strings)
-        
-        # Setup dropdown with model
-        self.season_selector.set_model(string_list)
-        self.season_selector.set_selected(0)  # Select first season
-        self.season_selector.connect('notify::selected', self.on_season_changed)
-        
-        # Show first season
-        self.populate_season(next(iter(seasons.keys())))
-
-        # Apply CSS styling
-        css_string = """
-        .episode-number {
-            min-width: 32px;
-            min-height: 32px;
-            padding: 0;
-            margin: 8px;
-            font-size: 14px;
-            font-weight: bold;
-            /* Use halign instead of text-align */
-            halign: center;
-            background: alpha(@accent_color, 0.15);
-            color: @accent_color;
-            border-radius: 50%;
-        }
-
-        .episode-number:disabled {
-            opacity: 1.0;
-        }
-
-        .episode-list row {
-            padding: 12px;
-            margin: 2px;
-        }
-
-        .episode-list row > box {
-            margin-start: 12px;
-            margin-end: 12px;
-        }
-
-        .rounded-corners {
-            border-radius: 12px;
-        }
-
-        .episode-row {
-            transition: background-color 200ms ease;
-            padding: 0;  /* Remove padding from row */
-            margin: 2px;
-            border-radius: 12px;
-            overflow: hidden;
-        }
-        
-        .episode-content {
-            padding: 12px;  /* Add padding to content box instead */
-        }
-        
-        .episode-progress {
-            min-height: 3px;
-            background-color: @accent_color;
-            margin: 0;
-            padding: 0;
-        }
-
-        .episode-progress trough {
-            min-height: 3px;
-            background-color: alpha(@accent_color, 0.1);
-            border: none;
-            border-radius: 0;
-            margin: 0;
-            padding: 0;
-        }
-
-        .episode-progress progress {
-            min-height: 3px;
-            background-color: @accent_color;
-            border-radius: 0;
-            margin: 0;
-            padding: 0;
-        }
-
-        .circular {
-            padding: 8px;
-            min-width: 36px;
-            min-height: 36px;
-            margin: 4px;
-            border-radius: 9999px;
-        }
-
-        .episode-list progressbar {
-            margin: 0;
-            padding: 0;
-            min-height: 3px;
-        }
-        
-        .episode-list progressbar.episode-progress {
-            margin-top: -12px;  /* Negative margin to position at top */
-            margin-bottom: 12px;
-            margin-start: -12px;
-            margin-end: -12px;
-        }
-        
-        .episode-list progressbar > trough {
-            min-height: 3px;
-            border: none;
-            background-color: transparent;
-        }
-        
-        .episode-list progressbar > trough > progress {
-            min-height: 3px;
-            background-color: @accent_color;
-            border-radius: 0;
-        }
-        
-        .episode-progress-container {
-            padding: 0;
-            margin: 0;
-        }
-
-        .episode-overlay {
-            margin: 0;
-            padding: 0;
-            border-radius: 12px; /* Match the row's rounded corners */
-            overflow: hidden;    /* Ensure the progress bar stays within bounds */
-        }
-
-        .episode-progress {
-            min-height: 4px;
-            margin: 0;
-            padding: 0;
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-        }
-
-        .episode-progress > trough {
-            min-height: 4px;
-            background-color: alpha(@accent_color, 0.1);
-            border: none;
-        }
-
-        .episode-progress > trough > progress {
-            min-height: 4px;
-            background-color: @accent_color;
-            border-radius: 0;
-        }
-
-        .episode-overlay {
-            border-radius: 12px;
-            overflow: hidden;
-        }
-        """
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(css_string.encode(), -1)
-        self.get_style_context().add_provider(css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-
-    def get_episode_progress(self, episode_path):
-        """Get progress percentage for an episode"""
+    def _load_timestamps(self):
+        """Read the saved playback positions"""
+        xdg_config = os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config'))
+        timestamps_file = os.path.join(xdg_config, 'hometheater', 'timestamps.json')
         try:
-            xdg_config = os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config'))
-            config_dir = os.path.join(xdg_config, 'hometheater')
-            timestamps_file = os.path.join(config_dir, 'timestamps.json')
-            
             if os.path.exists(timestamps_file):
                 with open(timestamps_file, 'r') as f:
-                    timestamps = json.load(f)
-                    if str(episode_path) in timestamps:
-                        position = float(timestamps[str(episode_path)])
-                        result = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', episode_path], capture_output=True, text=True)
-                        duration = float(result.stdout.strip())
-                        if position > 10:
-                            progress = min(position / duration, 1.0)
-                            return progress
+                    return json.load(f)
         except Exception as e:
             print(f"Error loading progress: {e}")
-        return 0
+        return {}
+
+    def _probe_duration(self, episode_path):
+        """Get the duration of a video in seconds using ffprobe"""
+        if episode_path not in self._durations:
+            result = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', episode_path], capture_output=True, text=True)
+            self._durations[episode_path] = float(result.stdout.strip())
+        return self._durations[episode_path]
+
+    def _update_progress(self, model):
+        """Set the progress of every row in a season model
+
+        Positions come from timestamps.json, durations that are not known
+        yet are probed on a worker thread so ffprobe never blocks the UI.
+        """
+        timestamps = self._load_timestamps()
+        to_probe = []
+        for i in range(model.get_n_items()):
+            row = model.get_item(i)
+            position = float(timestamps.get(row.path, 0) or 0)
+            if position <= 10:
+                row.props.progress = 0.0
+            elif row.path in self._durations:
+                row.props.progress = min(position / self._durations[row.path], 1.0)
+            else:
+                to_probe.append((row, position))
+
+        if not to_probe:
+            return
+
+        def probe():
+            for row, position in to_probe:
+                try:
+                    duration = self._probe_duration(row.path)
+                except Exception as e:
+                    print(f"Error loading progress: {e}")
+                    continue
+                self.parent_window.dispatcher.call(
+                    row.set_property, 'progress', min(position / duration, 1.0))
+
+        threading.Thread(target=probe, daemon=True).start()
 
     def mark_as_watched(self, episode_path):
         """Remove timestamp entry for an episode"""
@@ -279,145 +398,153 @@ class EpisodesUI(Gtk.Box):
                     with open(timestamps_file, 'w') as f:
                         json.dump(timestamps, f, indent=4)
                     
-                    # Refresh the current season view
-                    selected = self.season_selector.get_selected()
-                    if selected != Gtk.INVALID_LIST_POSITION:
-                        season_text = self.season_selector.get_model().get_string(selected)
-                        season_num = season_text.split()[-1]
-                        self.populate_season(season_num)
+                    # Only the affected row changes
+                    for model in self._season_models.values():
+                        for i in range(model.get_n_items()):
+                            row = model.get_item(i)
+                            if row.path == str(episode_path):
+                                row.props.progress = 0.0
                         
         except Exception as e:
             print(f"Error marking episode as watched: {e}")
 
-    def populate_season(self, season_num):
-        """Populate episodes for given season"""
-        episodes = self.seasons[season_num]
+    def _build_season_model(self, season_num):
+        """Compute number, title, subtitle and progress for every episode once"""
+        numbered = []
+        for episode in self.seasons[season_num]:
+            ep_num = episode_number(release_info(episode))
+            numbered.append((ep_num, episode))
         
-        # Clear existing episodes
-        while (child := self.episodes_box.get_first_child()):
-            self.episodes_box.remove(child)
-        
-        # Sort episodes by episode number
-        sorted_episodes = []
-        for episode in episodes:
-            try:
-                filename = Path(episode['path']).stem
-                ep_match = re.search(r'[Ss]\d+[Ee](\d+)|[Ee](\d+)|(\d+)$', filename)
-                if ep_match:
-                    ep_num = int(ep_match.group(1) or ep_match.group(2) or ep_match.group(3))
-                    sorted_episodes.append((ep_num, episode))
-            except Exception as e:
-                print(f"Error parsing episode number: {e}")
-                # Add episodes without numbers to the end
-                sorted_episodes.append((float('inf'), episode))
-        
-        # Sort by episode number
-        sorted_episodes.sort(key=lambda x: x[0])
-        
-        for ep_num, episode in sorted_episodes:
+        # Sort by episode number, episodes without numbers go to the end
+        numbered.sort(key=lambda x: float('inf') if x[0] is None else x[0])
+
+        model = Gio.ListStore(item_type=EpisodeRow)
+        for ep_num, episode in numbered:
             # Get combined show and episode metadata
-            episode_path = episode['path']
-            metadata = self.parent_window.get_episode_metadata(episode_path)
+            metadata = self.parent_window.get_episode_metadata(episode['path'])
+            title, subtitle = self._describe_episode(ep_num, episode, metadata)
+            model.append(EpisodeRow(
+                episode,
+                number=-1 if ep_num is None else ep_num,
+                title=title,
+                subtitle=subtitle
+            ))
+
+        self._update_progress(model)
+        return model
+
+    def _describe_episode(self, ep_num, episode, metadata):
+        """Return the row title and subtitle for an episode"""
+        fallback = f"Episode {ep_num}" if ep_num is not None else Path(episode['path']).stem
+
+        # Get episode title without the episode number prefix
+        if metadata:
+            episode_title = metadata.get('episode_title') or metadata.get('title') or fallback
+        else:
+            episode_title = fallback
+
+        subtitle = ''
+        if metadata:
+            subtitle_parts = []
+            if metadata.get('air_date'):
+                subtitle_parts.append(metadata['air_date'])
+            if metadata.get('rating'):
+                subtitle_parts.append(f"★ {metadata['rating']}")
             
-            # Create content box for padding
-            content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-            content_box.add_css_class('episode-content')
-
-            progress = self.get_episode_progress(episode_path)
-            if progress > 0:
-                # Create the progress bar at the top
-                progress_bar = Gtk.ProgressBar()
-                progress_bar.set_fraction(progress)
-                progress_bar.add_css_class('episode-progress')
-                content_box.append(progress_bar)
-
-            # Add episode number and title
-            row = Adw.ActionRow()
-            row.add_css_class('episode-row')
-
-            # Add episode number button
-            ep_button = Gtk.Button()
-            ep_button.set_label(str(ep_num))
-            ep_button.add_css_class('circular')
-            ep_button.add_css_class('episode-number')
-            ep_button.set_valign(Gtk.Align.CENTER)
-            ep_button.add_css_class('flat')
-            ep_button.set_sensitive(False)
-            row.add_prefix(ep_button)
-
-            # Get episode title without the episode number prefix
-            if metadata:
-                if metadata.get('episode_title'):
-                    episode_title = metadata['episode_title']
-                elif metadata.get('title'):
-                    episode_title = metadata['title']
-                else:
-                    episode_title = f"Episode {ep_num}"
-            else:
-                episode_title = f"Episode {ep_num}"
-                
-            row.set_title(episode_title)
+            # Add episode guest cast if available
+            if metadata.get('guest_cast'):
+                guest_cast = metadata['guest_cast'][:3]  # Show up to 3 guest stars
+                if guest_cast:
+                    subtitle_parts.append("Guest starring: " + ", ".join(guest_cast))
             
-            # Add episode metadata if available
-            if metadata:
-                subtitle_parts = []
-                if metadata.get('air_date'):
-                    subtitle_parts.append(metadata['air_date'])
-                if metadata.get('rating'):
-                    subtitle_parts.append(f"★ {metadata['rating']}")
-                
-                # Add episode guest cast if available
-                if metadata.get('guest_cast'):
-                    guest_cast = metadata['guest_cast'][:3]  # Show up to 3 guest stars
-                    if guest_cast:
-                        subtitle_parts.append("Guest starring: " + ", ".join(guest_cast))
-                
-                if subtitle_parts:
-                    row.set_subtitle(' • '.join(subtitle_parts))
-                
-                # Add plot as subtitle if available
-                if metadata.get('plot'):
-                    plot = metadata['plot']
-                    # Clean HTML from plot
-                    plot = re.sub(r'<[^>]+>', '', plot)
-                    plot = html.unescape(plot)
-                    if len(plot) > 200:
-                        plot = plot[:197] + "..."
-                    if subtitle_parts:
-                        row.set_subtitle(row.get_subtitle() + "\n" + plot)
-                    else:
-                        row.set_subtitle(plot)
-
-            # Add watched button if there's progress
-            if progress > 0:
-                watched_button = Gtk.Button()
-                watched_button.set_icon_name('check-plain-symbolic')
-                watched_button.set_valign(Gtk.Align.CENTER)
-                watched_button.add_css_class('circular')
-                watched_button.add_css_class('flat')
-                # Create a closure to properly capture the episode path
-                def make_watched_handler(ep_path):
-                    return lambda b: self.mark_as_watched(ep_path)
-                watched_button.connect('clicked', make_watched_handler(episode_path))
-                row.add_suffix(watched_button)
-
-            # Add play button
-            play_button = Gtk.Button()
-            play_button.set_icon_name('media-playback-start-symbolic')
-            play_button.set_valign(Gtk.Align.CENTER)
-            play_button.add_css_class('circular')
-            play_button.add_css_class('flat')
-            # Create a closure to properly capture the episode
-            def make_click_handler(ep):
-                return lambda b: self.on_episode_clicked(ep)
-            play_button.connect('clicked', make_click_handler(episode))
-            row.add_suffix(play_button)
-
-            # Add row to content box
-            content_box.append(row)
-
-            # Add content box to episodes box
-            self.episodes_box.append(content_box)
+            subtitle = ' • '.join(subtitle_parts)
+            
+            # Add plot as subtitle if available
+            if metadata.get('plot'):
+                plot = HTML_TAG_RE.sub('', metadata['plot'])
+                plot = html.unescape(plot)
+                if len(plot) > 200:
+                    plot = plot[:197] + "..."
+                subtitle = subtitle + "\n" + plot if subtitle else plot
+
+        return episode_title, subtitle
+
+    def populate_season(self, season_num):
+        """Show the episodes of a season, building its model on first use"""
+        model = self._season_models.get(season_num)
+        if model is None:
+            model = self._season_models[season_num] = self._build_season_model(season_num)
+        self.selection.set_model(model)
+
+    def _on_row_setup(self, factory, list_item):
+        """Build the widgets for one recycled row"""
+        # Create content box for padding
+        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        content_box.add_css_class('episode-content')
+
+        # Progress bar at the top, only shown for started episodes
+        progress_bar = Gtk.ProgressBar()
+        progress_bar.add_css_class('episode-progress')
+        content_box.append(progress_bar)
+
+        row = Adw.ActionRow()
+        row.add_css_class('episode-row')
+
+        # Add episode number button
+        ep_button = Gtk.Button()
+        ep_button.add_css_class('circular')
+        ep_button.add_css_class('episode-number')
+        ep_button.set_valign(Gtk.Align.CENTER)
+        ep_button.add_css_class('flat')
+        ep_button.set_sensitive(False)
+        row.add_prefix(ep_button)
+
+        # Add watched button, only shown if there's progress
+        watched_button = Gtk.Button()
+        watched_button.set_icon_name('check-plain-symbolic')
+        watched_button.set_valign(Gtk.Align.CENTER)
+        watched_button.add_css_class('circular')
+        watched_button.add_css_class('flat')
+        watched_button.connect(
+            'clicked', lambda b: self.mark_as_watched(list_item.get_item().path))
+        row.add_suffix(watched_button)
+
+        # Add play button
+        play_button = Gtk.Button()
+        play_button.set_icon_name('media-playback-start-symbolic')
+        play_button.set_valign(Gtk.Align.CENTER)
+        play_button.add_css_class('circular')
+        play_button.add_css_class('flat')
+        play_button.connect(
+            'clicked', lambda b: self.on_episode_clicked(list_item.get_item().episode))
+        row.add_suffix(play_button)
+
+        content_box.append(row)
+        list_item.set_child(content_box)
+        list_item.set_activatable(False)
+        list_item.widgets = (progress_bar, row, ep_button, watched_button)
+
+    def _on_row_bind(self, factory, list_item):
+        item = list_item.get_item()
+        self._sync_row(item, None, list_item)
+        list_item.notify_handler = item.connect('notify', self._sync_row, list_item)
+
+    def _on_row_unbind(self, factory, list_item):
+        item = list_item.get_item()
+        if item is not None and getattr(list_item, 'notify_handler', None):
+            item.disconnect(list_item.notify_handler)
+        list_item.notify_handler = None
+
+    def _sync_row(self, item, pspec, list_item):
+        """Copy an EpisodeRow into the widgets it is bound to"""
+        progress_bar, row, ep_button, watched_button = list_item.widgets
+        ep_button.set_label(str(item.props.number) if item.props.number >= 0 else '')
+        row.set_title(item.props.title)
+        row.set_subtitle(item.props.subtitle)
+        progress = item.props.progress
+        progress_bar.set_fraction(progress)
+        progress_bar.set_visible(progress > 0)
+        watched_button.set_visible(progress > 0)
 
     def on_season_changed(self, dropdown, *args):
         # Get selected season number from dropdown
@@ -436,12 +563,10 @@ class EpisodesUI(Gtk.Box):
         )
 
     def refresh_current_season(self):
-        """Refresh the current season view"""
-        selected = self.season_selector.get_selected()
-        if selected != Gtk.INVALID_LIST_POSITION:
-            season_text = self.season_selector.get_model().get_string(selected)
-            season_num = season_text.split()[-1]
-            self.populate_season(season_num)
+        """Refresh the progress shown for the current season"""
+        model = self.selection.get_model()
+        if model is not None:
+            self._update_progress(model)
 
 class RoundedPicture(Gtk.DrawingArea):
     def __init__(self):
@@ -0,0 +1,181 @@
+# fetchstats.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import time
+import threading
+from collections import defaultdict
+from gettext import gettext as _
+from pathlib import Path
+
+
+def _format_duration(seconds):
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {seconds:02d}s"
+    return f"{seconds}s"
+
+
+def _format_bytes(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class FetchStats:
+    """Live counters for one metadata refresh
+
+    Updated from the fetch worker and read from the main loop. Throughput
+    is an exponentially weighted moving average of the time per item, so
+    the ETA follows recent speed rather than the whole-run average.
+    """
+
+    def __init__(self, total_items, alpha=0.2):
+        self.total_items = total_items
+        self.alpha = alpha
+        self.started = time.monotonic()
+        self.items_done = 0
+        self.items_skipped = 0
+        self.requests = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.bytes = defaultdict(int)
+        self.cache_hits = 0
+        self.shared_requests = defaultdict(int)
+        self._avg_item_seconds = None
+        self._last_item = self.started
+        self._lock = threading.Lock()
+
+    def item_done(self, skipped=False):
+        """Count a finished movie or show"""
+        with self._lock:
+            now = time.monotonic()
+            self.items_done += 1
+            if skipped:
+                self.items_skipped += 1
+            else:
+                elapsed = now - self._last_item
+                if self._avg_item_seconds is None:
+                    self._avg_item_seconds = elapsed
+                else:
+                    self._avg_item_seconds = (self.alpha * elapsed +
+                                              (1 - self.alpha) * self._avg_item_seconds)
+            self._last_item = now
+
+    def request(self, provider, size, ok=True):
+        with self._lock:
+            self.requests[provider] += 1
+            self.bytes[provider] += size
+            if not ok:
+                self.errors[provider] += 1
+
+    def shared(self, provider):
+        """A request that was answered by an identical one"""
+        with self._lock:
+            self.shared_requests[provider] += 1
+
+    def add_bytes(self, provider, size):
+        with self._lock:
+            self.bytes[provider] += size
+
+    def error(self, source):
+        with self._lock:
+            self.errors[source] += 1
+
+    def cache_hit(self):
+        with self._lock:
+            self.cache_hits += 1
+
+    @property
+    def total_requests(self):
+        with self._lock:
+            return sum(self.requests.values())
+
+    @property
+    def items_remaining(self):
+        return max(self.total_items - self.items_done, 0)
+
+    def throughput(self):
+        """Items per minute, or None before the first fetched item"""
+        with self._lock:
+            if not self._avg_item_seconds:
+                return None
+            return 60 / self._avg_item_seconds
+
+    def eta(self):
+        """Seconds left at the current rate, or None if unknown"""
+        with self._lock:
+            if self._avg_item_seconds is None:
+                return None
+            return self.items_remaining * self._avg_item_seconds
+
+    def summary(self):
+        """Plain dict of all counters"""
+        throughput = self.throughput()
+        with self._lock:
+            return {
+                'elapsed': round(time.monotonic() - self.started, 1),
+                'total_items': self.total_items,
+                'items_done': self.items_done,
+                'items_skipped': self.items_skipped,
+                'requests': dict(self.requests),
+                'errors': dict(self.errors),
+                'bytes': dict(self.bytes),
+                'cache_hits': self.cache_hits,
+                'shared_requests': dict(self.shared_requests),
+                'items_per_minute': round(throughput, 2) if throughput else None,
+            }
+
+    def format_progress(self):
+        """Multi-line status for the progress dialog"""
+        summary = self.summary()
+        eta = self.eta()
+        throughput = summary['items_per_minute']
+
+        lines = [
+            _("{done} of {total} items, {remaining} remaining").format(
+                done=summary['items_done'], total=summary['total_items'],
+                remaining=self.items_remaining),
+            _("{rate} items/min, about {eta} left").format(
+                rate=f"{throughput:.1f}" if throughput else "–",
+                eta=_format_duration(eta) if eta is not None else "–"),
+        ]
+        requests = ", ".join(f"{name} {count}" for name, count in sorted(summary['requests'].items()))
+        lines.append(_("Requests: {}").format(requests or "0"))
+        lines.append(_("{size} downloaded, {hits} cache hits, {errors} errors").format(
+            size=_format_bytes(sum(summary['bytes'].values())),
+            hits=summary['cache_hits'],
+            errors=sum(summary['errors'].values())))
+        return "\n".join(lines)
+
+    def write_summary(self, log_path, cancelled=False):
+        """Append this run to the refresh log for comparison between runs"""
+        entry = {'time': int(time.time()), 'cancelled': cancelled, **self.summary()}
+        try:
+            log_path = Path(log_path)
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+        except OSError as e:
+            print(f"Error writing refresh log: {e}")
@@ -0,0 +1,92 @@
+# freshness.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# How long fetched metadata stays fresh. Fields are grouped in classes
+# that change at a similar rate and are refreshed together, the time each
+# class was last fetched is kept in the entry's 'fetched_at' dict.
+import time
+from typing import Dict, List, Tuple
+
+DAY = 24 * 60 * 60
+
+# Ratings and episode data change, plots, cast and biographies hardly ever.
+# Title, year and plot of movies and shows can be edited by the user and
+# are never overwritten by a revalidation.
+TTL = {
+    'ratings': 7 * DAY,
+    'episodes': 7 * DAY,
+    'details': 180 * DAY,
+    'people': 365 * DAY,
+}
+
+FIELDS = {
+    'ratings': ('rating',),
+    'episodes': ('title', 'plot', 'air_date', 'rating'),
+    'details': ('genres', 'cast', 'director'),
+    'people': ('cast_bios', 'director_bios'),
+}
+
+# Classes that apply to each kind of entry
+CLASSES = {
+    'movie': ('ratings', 'details', 'people'),
+    'show': ('ratings', 'details', 'episodes'),
+}
+
+
+def stamp(metadata: Dict, classes, now=None):
+    """Mark the given field classes of an entry as fetched now"""
+    now = int(now or time.time())
+    fetched_at = dict(metadata.get('fetched_at', {}))
+    for name in classes:
+        fetched_at[name] = now
+    metadata['fetched_at'] = fetched_at
+
+
+def expired_classes(metadata: Dict, now=None) -> List[str]:
+    """Field classes of an entry that are past their TTL
+
+    Entries from before freshness was tracked count as expired, they are
+    revalidated once and stamped.
+    """
+    now = now or time.time()
+    fetched_at = metadata.get('fetched_at', {})
+    return [name for name in CLASSES.get(metadata.get('type'), ())
+            if now - fetched_at.get(name, 0) > TTL[name]]
+
+
+def due_items(metadata: Dict[str, Dict], keys, now=None) -> List[Tuple[str, List[str]]]:
+    """(key, expired classes) for matched entries, longest overdue first
+
+    Entries read from local sidecar files are authoritative and skipped,
+    entries with only embedded tags were never matched and are left to a
+    refresh.
+    """
+    now = now or time.time()
+    due = []
+    for key in keys:
+        entry = metadata.get(key)
+        if not entry or not entry.get('title') or entry.get('source') in ('nfo', 'embedded'):
+            continue
+        classes = expired_classes(entry, now)
+        if classes:
+            fetched_at = entry.get('fetched_at', {})
+            overdue = max(now - fetched_at.get(name, 0) - TTL[name] for name in classes)
+            due.append((overdue, key, classes))
+    due.sort(key=lambda item: item[0], reverse=True)
+    return [(key, classes) for _, key, classes in due]
@@ -2,7 +2,6 @@ import gi
 import subprocess
 from pathlib import Path
 
-from .player import HomeTheaterPlayer
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, GObject, Gio, GLib, GdkPixbuf, Gdk, Gsk, Graphene
@@ -64,6 +63,12 @@ class AvatarPicture(Gtk.DrawingArea):
                 self._realize_handler = self.connect('realize', self._on_realize)
         
         self.queue_draw()
+
+    def set_pixbuf(self, pixbuf):
+        """Show an already decoded image"""
+        self.pixbuf = pixbuf
+        self.pending_icon = None
+        self.queue_draw()
     
     def _on_realize(self, widget):
         if self.pending_icon:
@@ -156,6 +161,10 @@ class PersonWidget(Gtk.Box):
         """Get the name of the person"""
         return self.name
 
+    def set_pixbuf(self, pixbuf):
+        """Replace the placeholder avatar with a decoded image"""
+        self.avatar.set_pixbuf(pixbuf)
+
 @Gtk.Template(resource_path='/space/koyu/hometheater/item.ui')
 class HomeTheaterItem(Gtk.Box):
     __gtype_name__ = 'HomeTheaterItem'
@@ -205,6 +214,24 @@ class HomeTheaterItem(Gtk.Box):
         self.edit_year_button.connect('clicked', self._on_edit_year_clicked)
         self.edit_plot_button.connect('clicked', self._on_edit_plot_clicked)
 
+        # Follow metadata changes while the page is shown
+        self._metadata_handler = None
+        self.connect('realize', self._on_realize)
+        self.connect('unrealize', self._on_unrealize)
+
+    def _on_realize(self, widget):
+        self._metadata_handler = self.window.connect('metadata-changed', self._on_window_metadata_changed)
+
+    def _on_unrealize(self, widget):
+        if self._metadata_handler:
+            self.window.disconnect(self._metadata_handler)
+            self._metadata_handler = None
+
+    def _on_window_metadata_changed(self, window, key):
+        if key == self.movie_data['path']:
+            window.fill_movie_details(self, self.movie_data)
+            self.emit('metadata-changed')
+
     @Gtk.Template.Callback()
     def on_refresh_clicked(self, button):
         """Handler for refresh button clicks"""
@@ -217,6 +244,8 @@ class HomeTheaterItem(Gtk.Box):
         # Launch video player (using xdg-open for Linux)
         if hasattr(self, 'video_path') and self.video_path:
             try:
+                # GStreamer is only loaded once something is played
+                from .player import HomeTheaterPlayer
                 player = HomeTheaterPlayer(self.window, self.video_path)
                 player.present()
             except Exception as e:
@@ -417,6 +446,7 @@ class HomeTheaterItem(Gtk.Box):
         person = PersonWidget(name, image_path)
         self.cast_flowbox.append(person)
         self._update_people_section_visibility()
+        return person
 
     def clear_directors(self):
         """Remove all directors from the flowbox"""
@@ -431,4 +461,5 @@ class HomeTheaterItem(Gtk.Box):
         """Add a director to the flowbox"""
         person = PersonWidget(name, image_path)
         self.directors_flowbox.append(person)
-        self._update_people_section_visibility()
\ No newline at end of file
+        self._update_people_section_visibility()
+        return person
\ No newline at end of file
@@ -0,0 +1,280 @@
+# library.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import re
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from . import releasename
+
+VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.avi', '.webm')
+
+# Metadata keys needed to draw the grids, sort and search before the
+# full metadata.json has been read
+SNAPSHOT_FIELDS = (
+    'title', 'year', 'rating', 'genres', 'poster', 'type',
+    'season', 'episode', 'is_episode', 'show_name'
+)
+
+SNAPSHOT_VERSION = 2
+
+# Codecs that give the better picture at the same resolution come first
+CODEC_RANK = {'AV1': 3, 'HEVC': 2, 'H.264': 1}
+
+
+def _is_video(path: Path) -> bool:
+    return path.is_file() and path.suffix.lower() in VIDEO_EXTENSIONS
+
+
+def scan_library(videos_dir: Path) -> Tuple[List[str], Dict[str, Dict[str, List[str]]]]:
+    """Walk the Movies and Shows folders and return the video files found
+
+    Returns:
+        A list of movie paths and a dict mapping show names to
+        {season number: [episode paths]}
+    """
+    movie_files = []
+    movies_path = videos_dir / "Movies"
+    if movies_path.is_dir():
+        for movie_file in movies_path.glob("**/*"):
+            if _is_video(movie_file):
+                movie_files.append(str(movie_file))
+
+    # Scan Shows directory with seasons support
+    show_files = {}
+    shows_path = videos_dir / "Shows"
+    if shows_path.is_dir():
+        for show_dir in shows_path.iterdir():
+            if not show_dir.is_dir():
+                continue
+            seasons = {}
+            # Look for season directories or episodes
+            for item in show_dir.iterdir():
+                if item.is_dir() and item.name.lower().startswith("season"):
+                    season_num = releasename.season_folder_number(item.name)
+                    episodes = [str(f) for f in item.glob("*") if _is_video(f)]
+                    if episodes:
+                        # "Season 1" and "Season 01" are the same season
+                        seasons.setdefault(season_num, []).extend(episodes)
+                elif _is_video(item):
+                    # Episode directly in show directory - assume season 1
+                    seasons.setdefault("1", []).append(str(item))
+            if seasons:
+                show_files[show_dir.name] = seasons
+
+    return movie_files, show_files
+
+
+def build_library(metadata: Dict, movie_files: List[str], show_files: Dict,
+                  releases: Optional[Dict] = None) -> Tuple[List[Dict], Dict]:
+    """Turn scanned paths into the movie and show entries used by the UI
+
+    releases are the parsed file names from the scan index, entries built
+    without them parse their name on first use, see release_info().
+
+    Movie files with the same title and year, like Inception.1080p.mkv and
+    Inception.2160p.mkv, are versions of one work and become one entry.
+    Its 'path' is the version the metadata is stored under and 'versions'
+    lists all of them, see choose_version().
+    """
+    releases = releases or {}
+    movies = []
+    for versions in _group_versions(movie_files, releases, metadata):
+        # Keep the metadata where it is, a new version doesn't move it
+        primary = next((v for v in versions if metadata.get(v['path'])), versions[0])
+        movies.append({
+            'path': primary['path'],
+            'title': primary['title'],
+            'metadata': metadata.get(primary['path'], {}),
+            'release': primary['release'],
+            'versions': versions
+        })
+
+    shows = {}
+    for show_name, seasons in show_files.items():
+        shows[show_name] = {
+            season_num: [
+                {
+                    'path': path,
+                    'title': Path(path).stem,
+                    'season': season_num,
+                    'metadata': metadata.get(path, {}),
+                    'release': releases.get(path)
+                }
+                for path in episodes
+            ]
+            for season_num, episodes in seasons.items()
+        }
+
+    return movies, shows
+
+
+# File names that say nothing about the movie, the folder name does
+GENERIC_STEMS = {'movie', 'film', 'video', 'feature', 'main', 'title', 'default'}
+
+
+def _work_key(path: str, release: Dict):
+    """(normalized title, year) that identifies the movie a file belongs to"""
+    folder = Path(path).parent
+    generic = release['title'].lower() in GENERIC_STEMS
+    if generic or release.get('year') is None:
+        # Movies/Dune (1984)/Dune.mkv, Movies/Alien (1979)/movie.mkv
+        folder_release = releasename.parse(folder.name)
+        if folder_release.get('year') is not None:
+            release = folder_release
+        elif generic:
+            # Nothing to go by, the file is a work of its own
+            return path, None
+    title = ' '.join(re.findall(r'\w+', release['title'].lower()))
+    return title, release.get('year')
+
+
+def _group_versions(movie_files: List[str], releases: Dict,
+                    metadata: Optional[Dict] = None) -> List[List[Dict]]:
+    """Group movie files by parsed title and year, in scan order
+
+    Files matched to different IMDb titles are never grouped.
+    """
+    metadata = metadata or {}
+    groups = {}
+    for path in movie_files:
+        version = {'path': path, 'title': Path(path).stem, 'release': releases.get(path)}
+        groups.setdefault(_work_key(path, release_info(version)), []).append(version)
+
+    # Files without a year join the only version of the title that has one
+    years = {}
+    for title, year in groups:
+        years.setdefault(title, []).append(year)
+    for title, title_years in years.items():
+        dated = [year for year in title_years if year is not None]
+        if None in title_years and len(dated) == 1:
+            groups[(title, dated[0])].extend(groups.pop((title, None)))
+
+    works = []
+    for versions in groups.values():
+        by_id = {}
+        for version in versions:
+            imdb_id = (metadata.get(version['path']) or {}).get('imdb_id')
+            by_id.setdefault(imdb_id, []).append(version)
+        matched = [ids for imdb_id, ids in by_id.items() if imdb_id]
+        if len(matched) > 1:
+            # Unmatched files go with the first matched title
+            matched[0].extend(by_id.get(None, []))
+            works.extend(matched)
+        else:
+            works.append(versions)
+    return [sorted(versions, key=lambda v: v['path']) for versions in works]
+
+
+def choose_version(entry: Dict, highest: bool = True) -> str:
+    """The path of the version of a movie to play
+
+    Versions are ranked by resolution, the highest or the lowest one wins,
+    then by codec. Files without a resolution in the name count as 1080p.
+    """
+    versions = entry.get('versions')
+    if not versions:
+        return entry['path']
+
+    def rank(version):
+        release = release_info(version)
+        resolution = int(release.get('resolution', '1080p')[:-1])
+        return (resolution if highest else -resolution, CODEC_RANK.get(release.get('codec'), 0))
+
+    return max(versions, key=rank)['path']
+
+
+def release_info(entry: Dict) -> Dict:
+    """The parsed release name of a movie or episode entry"""
+    if entry.get('release') is None:
+        entry['release'] = releasename.parse(entry['title'])
+    return entry['release']
+
+
+def is_matched(metadata: Dict) -> bool:
+    """Whether an entry was identified, tags read from the file itself only
+    give a title to show until a provider or sidecar fills in the rest"""
+    return bool(metadata.get('title')) and metadata.get('source') != 'embedded'
+
+
+def load_metadata(metadata_file: Path) -> Dict:
+    """Read metadata.json, returning an empty dict if it is missing or broken"""
+    try:
+        with open(metadata_file, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+class LibrarySnapshot:
+    """Compact copy of the last library view used to paint the first frame"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load(self) -> Optional[Tuple[Dict, List[str], Dict, Dict]]:
+        """Return (metadata, movie_files, show_files, releases) or None if unusable"""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if data.get('version') != SNAPSHOT_VERSION:
+            return None
+
+        return (data.get('metadata', {}), data.get('movies', []), data.get('shows', {}),
+                data.get('releases', {}))
+
+    def save(self, metadata: Dict, movie_files: List[str], show_files: Dict, releases: Dict):
+        """Write the snapshot, keeping only what the grids need
+
+        The parsed names of movie files are kept so versions of a movie
+        are grouped without parsing names at startup.
+        """
+        keys = set(movie_files)
+        for show_name, seasons in show_files.items():
+            keys.add(f"show:{show_name}")
+            for episodes in seasons.values():
+                keys.update(episodes)
+
+        compact = {}
+        for key in keys:
+            entry = metadata.get(key)
+            if entry:
+                compact[key] = {k: entry[k] for k in SNAPSHOT_FIELDS if k in entry}
+
+        data = {
+            'version': SNAPSHOT_VERSION,
+            'metadata': compact,
+            'movies': movie_files,
+            'shows': show_files,
+            'releases': {path: releases[path] for path in movie_files if path in releases}
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving library snapshot: {e}")
@@ -0,0 +1,138 @@
+# negativecache.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Optional, Set
+
+CACHE_VERSION = 1
+
+DAY = 24 * 60 * 60
+
+
+class NegativeCache:
+    """Lookups that found nothing, so they are not repeated on every refresh
+
+    Entries are keyed by kind (e.g. "imdb-movie", "wikipedia-person") and
+    query, and remember why the lookup failed and which library items it
+    was made for. A failed lookup is retried after base_interval, and the
+    interval doubles with every further miss up to max_interval.
+    Network errors are not misses and must not be recorded here.
+    """
+
+    def __init__(self, path: Path, base_interval=DAY, max_interval=90 * DAY):
+        self.path = Path(path)
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(kind, query):
+        return f"{kind}:{query.strip().lower()}"
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        if data.get('version') == CACHE_VERSION:
+            with self._lock:
+                self.entries = data.get('entries', {})
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                'version': CACHE_VERSION,
+                'entries': dict(self.entries)
+            }
+            self._dirty = False
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving negative cache: {e}")
+
+    def should_skip(self, kind: str, query: str) -> bool:
+        """Return True while a recorded miss is not due for a re-check"""
+        with self._lock:
+            entry = self.entries.get(self._key(kind, query))
+            return entry is not None and time.time() < entry['next_check']
+
+    def reason(self, kind: str, query: str) -> Optional[str]:
+        with self._lock:
+            entry = self.entries.get(self._key(kind, query))
+            return entry['reason'] if entry else None
+
+    def waiting_items(self, kinds) -> Set[str]:
+        """Library items with a miss of one of kinds that is not due yet"""
+        now = time.time()
+        with self._lock:
+            return {item for key, entry in self.entries.items()
+                    if key.split(':', 1)[0] in kinds and now < entry['next_check']
+                    for item in entry.get('items', [])}
+
+    def record_miss(self, kind: str, query: str, reason: str, item: Optional[str] = None):
+        """Remember a lookup that found nothing and schedule its re-check"""
+        now = time.time()
+        with self._lock:
+            key = self._key(kind, query)
+            entry = self.entries.get(key, {'misses': 0, 'items': []})
+            entry['misses'] += 1
+            entry['reason'] = reason
+            entry['last_checked'] = int(now)
+            interval = min(self.base_interval * 2 ** (entry['misses'] - 1), self.max_interval)
+            entry['next_check'] = int(now + interval)
+            if item and item not in entry['items']:
+                entry['items'].append(item)
+            self.entries[key] = entry
+            self._dirty = True
+
+    def record_hit(self, kind: str, query: str):
+        """Drop the entry for a lookup that matched after all"""
+        with self._lock:
+            if self.entries.pop(self._key(kind, query), None) is not None:
+                self._dirty = True
+
+    def clear_item(self, item: str) -> int:
+        """Forget the misses recorded for one library item, returns how many"""
+        with self._lock:
+            keys = [key for key, entry in self.entries.items() if item in entry.get('items', [])]
+            for key in keys:
+                del self.entries[key]
+            if keys:
+                self._dirty = True
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self.entries = {}
+            self._dirty = True
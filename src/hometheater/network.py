@@ -0,0 +1,309 @@
+# network.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Shared HTTP helpers for the provider clients and image downloads. This
+# module imports requests, only import it from code that is about to use
+# the network.
+import os
+import requests
+import socket
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from requests.adapters import HTTPAdapter
+from .cancellation import Cancelled
+
+# (connect, read) timeout for requests that don't set their own. A
+# cancel aborts a connected request at once, also while it still waits
+# for the response headers. The connect timeout bounds how long
+# a cancelled job can still wait on a connection attempt.
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Base URL of a local stand-in for the providers, like the one in
+# tools/provider-standin. Each provider is then served under its name,
+# https://api.tvmaze.com/shows/1 becomes $HOMETHEATER_PROVIDER_URL/tvmaze/shows/1
+PROVIDER_URL = os.environ.get('HOMETHEATER_PROVIDER_URL', '').rstrip('/')
+
+# Identical GETs that run at the same time share one request, and a
+# successful response is kept in memory for a short while so immediate
+# repeats, like a person in the cast of several movies or the episode
+# list TVmaze returns for every season of a show, aren't fetched again.
+MEMO_TTL = 120
+MEMO_BUDGET = 32 * 1024 * 1024
+
+_lock = threading.Lock()
+_in_flight = {}
+# key -> (expiry, response), least recently used first
+_memo = OrderedDict()
+_memo_size = 0
+
+
+def provider_url(provider, url):
+    """URL of a provider endpoint, moved to the stand-in if one is set"""
+    if not PROVIDER_URL:
+        return url
+    parts = urlsplit(url)
+    return f"{PROVIDER_URL}/{provider}{parts.path}" + (f"?{parts.query}" if parts.query else '')
+
+
+def request_key(provider, url, params=None):
+    """Key of a GET request, the same for URLs that only differ in the
+    order of their query parameters or the case of the host"""
+    prepared = requests.models.PreparedRequest()
+    prepared.prepare_url(url, params)
+    parts = urlsplit(prepared.url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return provider, urlunsplit((parts.scheme.lower(), parts.netloc.lower(),
+                                 parts.path or '/', query, ''))
+
+
+def _memo_get(key):
+    entry = _memo.get(key)
+    if entry is None:
+        return None
+    expiry, response = entry
+    if expiry < time.monotonic():
+        _memo_pop(key)
+        return None
+    _memo.move_to_end(key)
+    return response
+
+
+def _memo_pop(key):
+    global _memo_size
+    _, response = _memo.pop(key)
+    _memo_size -= len(response.content)
+
+
+def _memo_put(key, response):
+    global _memo_size
+    size = len(response.content)
+    if size > MEMO_BUDGET // 4:
+        return
+    if key in _memo:
+        _memo_pop(key)
+    _memo[key] = (time.monotonic() + MEMO_TTL, response)
+    _memo_size += size
+    while _memo_size > MEMO_BUDGET:
+        _memo_pop(next(iter(_memo)))
+
+
+def _wait(future, token):
+    # Poll so a cancelled follower doesn't wait for the leader's request
+    while True:
+        if token:
+            token.raise_if_cancelled()
+        try:
+            return future.result(timeout=0.1)
+        except FutureTimeout:
+            continue
+
+
+def get(provider, url, stats=None, token=None, **kwargs):
+    """requests.get() that records the request in a FetchStats, if given
+
+    Concurrent identical requests share one response, and a successful
+    response is reused for MEMO_TTL seconds. Shared responses are counted
+    as shared instead of as requests. Streamed requests are never shared.
+
+    Args:
+        provider: name the request is counted under (imdb, tvmaze, ...)
+        url: URL to fetch
+        stats: optional FetchStats of the running refresh
+        token: optional CancellationToken, raises Cancelled once it is
+            cancelled and aborts the body read if it happens mid-request
+        **kwargs: passed on to requests.get()
+    """
+    if token:
+        token.raise_if_cancelled()
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    if kwargs.get('stream'):
+        return _fetch(provider, url, stats, token, **kwargs)
+
+    key = request_key(provider, url, kwargs.get('params'))
+    while True:
+        with _lock:
+            response = _memo_get(key)
+            future = _in_flight.get(key) if response is None else None
+            leader = response is None and future is None
+            if leader:
+                future = _in_flight[key] = Future()
+        if leader:
+            break
+        if response is None:
+            try:
+                response = _wait(future, token)
+            except Cancelled:
+                if token and token.cancelled:
+                    raise
+                # Only the request we waited for was cancelled, try again
+                continue
+        if stats:
+            stats.shared(provider)
+        return response
+
+    try:
+        response = _fetch(provider, url, stats, token, **kwargs)
+    except BaseException as e:
+        with _lock:
+            del _in_flight[key]
+        future.set_exception(e)
+        raise
+    with _lock:
+        del _in_flight[key]
+        if response.ok:
+            _memo_put(key, response)
+    future.set_result(response)
+    return response
+
+
+class _SocketCloser:
+    """Shuts down the socket of a pooled connection when its token is
+    cancelled. shutdown() wakes up a thread blocked in recv(), close()
+    alone doesn't."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def close(self):
+        sock = getattr(self.connection, 'sock', None)
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+def _cancellable_pool(pool_class, token):
+    class CancellablePool(pool_class):
+        def _get_conn(self, timeout=None):
+            connection = super()._get_conn(timeout=timeout)
+            connection._cancel_closer = _SocketCloser(connection)
+            try:
+                token.register(connection._cancel_closer)
+            except Cancelled:
+                self._put_conn(connection)
+                raise
+            return connection
+
+        def _put_conn(self, connection):
+            closer = getattr(connection, '_cancel_closer', None)
+            if closer is not None:
+                token.unregister(closer)
+                connection._cancel_closer = None
+            super()._put_conn(connection)
+
+    return CancellablePool
+
+
+class _CancellableAdapter(HTTPAdapter):
+    """Adapter whose connections are registered with a token from before
+    the request is sent, so a cancel also aborts a request that is still
+    waiting for the server to answer"""
+
+    def __init__(self, token):
+        self.token = token
+        super().__init__()
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _cancellable_pool(pool_class, self.token)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+def _fetch(provider, url, stats, token, **kwargs):
+    stream = kwargs.pop('stream', False)
+
+    response = None
+    try:
+        # Always stream so the response can be registered with the token
+        # before its body is read
+        if token:
+            # Like requests.get(), one session per request that is closed
+            # right away, a streamed response keeps its connection until
+            # the response itself is closed
+            with requests.Session() as session:
+                adapter = _CancellableAdapter(token)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                response = session.get(url, stream=True, **kwargs)
+            token.register(response)
+        else:
+            response = requests.get(url, stream=True, **kwargs)
+        if not stream:
+            # Read the whole body while the token can still abort it
+            response.content
+    except Exception as e:
+        if response is not None:
+            if token:
+                token.unregister(response)
+            response.close()
+        if stats:
+            stats.request(provider, 0, ok=False)
+        if token and token.cancelled:
+            raise Cancelled() from e
+        raise
+
+    # A streamed response stays registered until download() closes it
+    if token and not stream:
+        token.unregister(response)
+    if stats:
+        size = 0 if stream else len(response.content)
+        stats.request(provider, size, ok=response.ok)
+    return response
+
+
+def download(provider, url, path, stats=None, token=None, headers=None, timeout=None):
+    """Stream a URL to a file and return the path as a string"""
+    response = get(provider, url, stats=stats, token=token, headers=headers,
+                   stream=True, timeout=timeout or DEFAULT_TIMEOUT)
+    try:
+        response.raise_for_status()
+
+        # Write next to the target and rename, so an interrupted download
+        # never leaves a truncated image in the cache
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.part')
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=8192):
+                    if token:
+                        token.raise_if_cancelled()
+                    f.write(chunk)
+                    if stats:
+                        stats.add_bytes(provider, len(chunk))
+            tmp_path.replace(path)
+        except Exception as e:
+            if token and token.cancelled and not isinstance(e, Cancelled):
+                raise Cancelled() from e
+            raise
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+    finally:
+        if token:
+            token.unregister(response)
+        response.close()
+    return str(path)
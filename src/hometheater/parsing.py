@@ -0,0 +1,94 @@
+# parsing.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# A small process pool for parsing fetched pages. The fetch threads stay
+# in this process for the network I/O and hand the raw response bytes to
+# a worker, so parsing several pages at once isn't serialized on the GIL
+# and doesn't compete with the main loop. Parse functions must be module
+# level functions of a module that only imports the standard library and
+# parser dependencies, like imdbparse, and return plain data.
+import os
+import threading
+from pathlib import Path
+
+# Workers are started with spawn, forking a process that runs GTK isn't
+# safe. A spawned worker would import the hometheater package to unpickle
+# a parse function, whose __init__ loads GTK and the resources. Register
+# an empty package instead so only the parser modules are imported.
+_BOOTSTRAP = f"""
+import sys, types
+package = types.ModuleType('hometheater')
+package.__path__ = [{str(Path(__file__).resolve().parent)!r}]
+sys.modules.setdefault('hometheater', package)
+"""
+
+_lock = threading.Lock()
+_executor = None
+# Set when the pool can't be used, pages are then parsed in the caller
+_disabled = os.environ.get('HOMETHEATER_PARSE_IN_PROCESS') == '1'
+
+
+def _pool():
+    global _executor
+    with _lock:
+        if _executor is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # Leave a core for the main loop and the fetch threads
+            workers = min(2, max(1, (os.cpu_count() or 2) - 1))
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=exec,
+                initargs=(_BOOTSTRAP, {}))
+        return _executor
+
+
+def run(func, *args):
+    """Call func(*args) in a worker process and return its result
+
+    Blocks the calling thread until the result is there, so call it from
+    a fetch thread, never from the main loop. Falls back to calling func
+    directly if the pool can't be started or its workers died.
+    """
+    global _disabled
+    if not _disabled:
+        from concurrent.futures.process import BrokenProcessPool
+        try:
+            future = _pool().submit(func, *args)
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Error starting the parser processes, parsing in-process: {e}")
+            _disabled = True
+        else:
+            try:
+                return future.result()
+            except BrokenProcessPool as e:
+                print(f"Error in a parser process, parsing in-process: {e}")
+                _disabled = True
+    return func(*args)
+
+
+def shutdown():
+    """Stop the worker processes, if any were started"""
+    global _executor, _disabled
+    with _lock:
+        executor, _executor = _executor, None
+        _disabled = True
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,145 @@
+# refreshqueue.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+QUEUE_VERSION = 1
+
+# Scheduling tiers, lower runs first. Jobs without a hint keep their
+# queue order after all hinted ones.
+PRIORITY_OPEN = 0
+PRIORITY_VISIBLE = 1
+PRIORITY_NEXT_SCREEN = 2
+PRIORITY_REST = 3
+
+
+class RefreshQueue:
+    """Persisted list of the items a metadata refresh still has to process
+
+    Jobs are metadata keys: a movie path or "show:<name>". A job is marked
+    done once its metadata is in memory, and the checkpoint is written
+    together with metadata.json, so a resumed refresh never skips an item
+    whose metadata did not reach the disk.
+
+    The UI can pass priority hints at any time, next_job() picks the most
+    urgent pending job when the worker asks for the next one.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.jobs = []
+        self.done = set()
+        self.force = False
+        self._priorities = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """Load an interrupted refresh, returns True if one is pending"""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+
+        if data.get('version') != QUEUE_VERSION:
+            return False
+
+        with self._lock:
+            self.jobs = data.get('jobs', [])
+            self.done = set(data.get('done', []))
+            self.force = data.get('force', False)
+        return bool(self.pending())
+
+    def start(self, jobs: List[str], force=False):
+        """Begin a new refresh over the given jobs"""
+        with self._lock:
+            self.jobs = list(jobs)
+            self.done = set()
+            self.force = force
+        self.save()
+
+    def keep_only(self, keys):
+        """Drop jobs for items that are no longer in the library"""
+        with self._lock:
+            self.jobs = [job for job in self.jobs if job in keys]
+
+    def pending(self) -> List[str]:
+        with self._lock:
+            return [job for job in self.jobs if job not in self.done]
+
+    def set_priorities(self, priorities: Dict[str, int]):
+        """Replace the scheduling hints, a dict of job to priority tier"""
+        with self._lock:
+            self._priorities = dict(priorities)
+
+    def next_job(self, skip=()) -> Optional[str]:
+        """Return the most urgent pending job not in skip, or None"""
+        with self._lock:
+            best = None
+            best_rank = None
+            for index, job in enumerate(self.jobs):
+                if job in self.done or job in skip:
+                    continue
+                rank = (self._priorities.get(job, PRIORITY_REST), index)
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = job, rank
+            return best
+
+    def mark_done(self, job: str):
+        with self._lock:
+            self.done.add(job)
+
+    @property
+    def finished(self) -> bool:
+        return not self.pending()
+
+    def save(self):
+        """Write the checkpoint"""
+        with self._lock:
+            data = {
+                'version': QUEUE_VERSION,
+                'force': self.force,
+                'jobs': self.jobs,
+                'done': sorted(self.done)
+            }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving refresh checkpoint: {e}")
+
+    def clear(self):
+        """Forget the refresh after it completed"""
+        with self._lock:
+            self.jobs = []
+            self.done = set()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing refresh checkpoint: {e}")
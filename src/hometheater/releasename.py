@@ -0,0 +1,160 @@
+# releasename.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Release name parsing: title, year, season and episode numbers, resolution,
+# source and codec from file names like Show.Name.S01E01E02.1080p.WEB-DL or
+# "[Group] Show - 012 [720p]". All tokens are found in a single scan of the
+# name, the result is cached per file in the scan index.
+import re
+import time
+from typing import Dict, Optional
+
+# Bump when the parser changes, so names cached in the scan index are
+# parsed again
+PARSER_VERSION = 2
+
+TOKEN_RE = re.compile(r"""
+    (?P<sxe>\bS(?P<season>\d{1,2})[ .-]?(?P<eps>E\d{1,4}(?:[ .-]?E\d{1,4})*)(?:-(?P<last>\d{1,4}))?\b)
+  | (?P<cross>\b(?P<cross_season>\d{1,2})x(?P<cross_episode>\d{2,3})\b)
+  | (?P<season_only>\b(?:S|Season[ .]?)(?P<season_num>\d{1,2})\b)
+  | (?P<episode>\b(?:E|Ep|Episode)[ .]?(?P<episode_num>\d{1,4})\b)
+  | (?P<dash>(?<=\s-\s)(?P<dash_num>\d{1,4})(?:v\d)?\b)
+  | (?P<year>\b(?:19|20)\d{2}\b)
+  | (?P<resolution>\b(?:480|576|720|1080|2160|4320)[pi]\b|\b(?:4K|UHD)\b)
+  | (?P<source>\b(?:Blu-?Ray|BDRip|BRRip|(?:BD)?Remux|WEB[ .-]?DL|WEB-?Rip|HDTV|DVDRip|HDRip)\b)
+  | (?P<codec>\b(?:[xh]\.?26[45]|HEVC|AVC|XviD|DivX|AV1)\b)
+  | (?P<bracket>[\[{])  # tags like [Extended] end the title, their contents are scanned
+  | (?P<trailing>\b\d{1,4}$)
+""", re.IGNORECASE | re.VERBOSE)
+
+EPISODE_NUMBER_RE = re.compile(r'\d+')
+
+SOURCES = {
+    'bluray': 'BluRay', 'blu-ray': 'BluRay', 'bdrip': 'BluRay', 'brrip': 'BluRay',
+    'remux': 'Remux', 'bdremux': 'Remux',
+    'hdtv': 'HDTV', 'dvdrip': 'DVD', 'hdrip': 'HDRip',
+}
+
+CODECS = {
+    'x264': 'H.264', 'h264': 'H.264', 'avc': 'H.264',
+    'x265': 'HEVC', 'h265': 'HEVC', 'hevc': 'HEVC',
+    'xvid': 'XviD', 'divx': 'DivX', 'av1': 'AV1',
+}
+
+# "[Group] " in front of anime style names
+GROUP_RE = re.compile(r'\s*\[[^\]]*\]')
+
+SEASON_FOLDER_RE = re.compile(r'season[ ._-]*(\d+)', re.IGNORECASE)
+
+
+def _clean_title(text: str) -> str:
+    # Dots and underscores are word separators unless the name has spaces
+    if ' ' not in text.strip():
+        text = text.replace('.', ' ')
+    return text.strip(' -([{').strip()
+
+
+def parse(name: str) -> Dict:
+    """Parse a file name without extension into its release name parts
+
+    The result only has the keys that were found: title, year, season,
+    episodes (a list, S01E01E02 gives [1, 2]), absolute (anime style or
+    trailing numbers), resolution, source and codec.
+    """
+    text = name.replace('_', ' ')
+    result = {}
+    title_end = len(text)
+    group = GROUP_RE.match(text)
+    title_start = group.end() if group else 0
+    years = []
+    max_year = time.localtime().tm_year + 1
+
+    for match in TOKEN_RE.finditer(text, title_start):
+        kind = match.lastgroup
+        start = match.start()
+        if kind == 'trailing':
+            # Trailing numbers are only an episode number fallback, they
+            # are part of titles like Ocean's 11
+            if start > title_start:
+                result.setdefault('absolute', int(match.group()))
+            continue
+        if kind == 'year':
+            # A year can't be the title itself, as in 1917
+            if text[title_start:start].strip() and int(match.group()) <= max_year:
+                years.append((start, int(match.group())))
+            continue
+
+        # Tokens at the very start, as in S01E02.mkv, don't end the title
+        if text[title_start:start].strip():
+            title_end = min(title_end, start)
+        if kind == 'sxe':
+            result.setdefault('season', int(match.group('season')))
+            episodes = [int(number) for number in EPISODE_NUMBER_RE.findall(match.group('eps'))]
+            if match.group('last'):
+                episodes = list(range(episodes[0], int(match.group('last')) + 1))
+            result.setdefault('episodes', episodes)
+        elif kind == 'cross':
+            result.setdefault('season', int(match.group('cross_season')))
+            result.setdefault('episodes', [int(match.group('cross_episode'))])
+        elif kind == 'season_only':
+            result.setdefault('season', int(match.group('season_num')))
+        elif kind == 'episode':
+            result.setdefault('episodes', [int(match.group('episode_num'))])
+        elif kind == 'dash':
+            result['absolute'] = int(match.group('dash_num'))
+        elif kind == 'resolution':
+            value = match.group().lower()
+            result.setdefault('resolution', '2160p' if value in ('4k', 'uhd') else value)
+        elif kind == 'source':
+            value = match.group().lower()
+            result.setdefault('source', SOURCES.get(value, 'WEB' if value.startswith('web') else value))
+        elif kind == 'codec':
+            result.setdefault('codec', CODECS[match.group().lower().replace('.', '')])
+
+    # The last year is the release year, an earlier one is part of the
+    # title as in Blade Runner 2049 (2017)
+    if years:
+        position, year = years[-1]
+        result['year'] = year
+        title_end = min(title_end, position)
+
+    # A name that is only a number, as in Season 1/01.mkv, is the episode
+    # number, even one that looks like a year
+    if text[title_start:].strip().isdigit():
+        result.setdefault('absolute', int(text[title_start:]))
+
+    title = _clean_title(text[title_start:title_end])
+    result['title'] = title or _clean_title(text)
+    return result
+
+
+def episode_number(release: Dict) -> Optional[int]:
+    """The (first) episode number of a parsed name"""
+    episodes = release.get('episodes')
+    if episodes:
+        return episodes[0]
+    return release.get('absolute')
+
+
+def season_folder_number(name: str) -> str:
+    """Season key for a folder like "Season 01" or "Season.2", as a string"""
+    match = SEASON_FOLDER_RE.match(name)
+    if match:
+        return str(int(match.group(1)))
+    return name.lower().replace("season", "").strip()
@@ -0,0 +1,259 @@
+# scanindex.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from . import releasename
+
+INDEX_VERSION = 1
+
+# Bytes hashed at the start and at the end of a file for its content id
+SAMPLE_SIZE = 64 * 1024
+
+# How long the id of a file that disappeared is kept, so a library that
+# was offline for a while is still recognized when it comes back elsewhere
+GONE_TTL = 90 * 24 * 60 * 60
+
+
+def movie_signature(path: str) -> str:
+    """A movie is identified by its path, a rename makes it a new item"""
+    return path
+
+
+def show_signature(seasons: Dict[str, List[Dict]]) -> str:
+    """Digest of a show's episode paths, changes when episodes come or go"""
+    paths = sorted(episode['path'] for episodes in seasons.values() for episode in episodes)
+    return hashlib.sha1('\n'.join(paths).encode()).hexdigest()[:16]
+
+
+def content_id(path: str, size: int) -> Optional[str]:
+    """Identify a file by its size and its first and last 64 KB
+
+    Cheap enough for network shares and stable across renames, moves and
+    remounts. Video files that share both ends and the size are the same
+    file for all practical purposes.
+    """
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    try:
+        with open(path, 'rb') as f:
+            digest.update(f.read(SAMPLE_SIZE))
+            if size > SAMPLE_SIZE:
+                f.seek(max(SAMPLE_SIZE, size - SAMPLE_SIZE))
+                digest.update(f.read(SAMPLE_SIZE))
+    except OSError as e:
+        print(f"Error reading {path}: {e}")
+        return None
+    return digest.hexdigest()
+
+
+class ScanIndex:
+    """What the library looked like when each item was last refreshed
+
+    Entries are keyed like metadata.json (movie path or "show:<name>") and
+    record the item's signature at its last refresh and whether a match
+    was found. Comparing the current scan against it tells which items a
+    delta refresh has to look at.
+
+    The parsed release name of every video file is kept here as well, so
+    file names are only parsed when a file is new, and a content id per
+    file that recognizes moved and renamed files, see find_moves().
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries = {}
+        self.releases = {}
+        self.identities = {}
+        self._dirty = False
+        # Content ids are filled in by the scanning thread while the main
+        # thread may save
+        self._lock = threading.Lock()
+
+    def load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+
+        if data.get('version') == INDEX_VERSION:
+            self.entries = data.get('entries', {})
+            if data.get('parser') == releasename.PARSER_VERSION:
+                self.releases = data.get('releases', {})
+            self.identities = data.get('identities', {})
+
+    def save(self):
+        if not self._dirty:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with self._lock:
+                data = {
+                    'version': INDEX_VERSION,
+                    'entries': self.entries,
+                    'parser': releasename.PARSER_VERSION,
+                    'releases': self.releases,
+                    'identities': self.identities
+                }
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f, separators=(',', ':'))
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+        except OSError as e:
+            print(f"Error saving scan index: {e}")
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.entries.get(key)
+
+    def update(self, key: str, **fields):
+        """Merge fields into the entry for key"""
+        with self._lock:
+            self.entries.setdefault(key, {}).update(fields)
+            self._dirty = True
+
+    def forget(self, key: str):
+        with self._lock:
+            if self.entries.pop(key, None) is not None:
+                self._dirty = True
+
+    def prune(self, keys: Iterable[str]):
+        """Forget items that are no longer in the library"""
+        keys = set(keys)
+        with self._lock:
+            stale = [key for key in self.entries if key not in keys]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self._dirty = True
+
+    def release_names(self, paths: Iterable[str]) -> Dict[str, Dict]:
+        """Parsed release names for the given video files
+
+        Files that were parsed before are looked up, new ones are parsed
+        and files that are gone are dropped.
+        """
+        releases = {}
+        for path in paths:
+            release = self.releases.get(path)
+            if release is None:
+                release = releasename.parse(Path(path).stem)
+                self._dirty = True
+            releases[path] = release
+        if len(releases) != len(self.releases):
+            self._dirty = True
+        self.releases = releases
+        return releases
+
+    def find_moves(self, paths: Iterable[str]) -> Dict[str, str]:
+        """Return {old path: new path} for files that were moved or renamed
+
+        Only new files with the size of a file that disappeared are read,
+        a scan without moves reads nothing. Ids of files that disappeared
+        are kept for a while, so a share that comes back at another mount
+        point later is still matched.
+        """
+        paths = set(paths)
+        now = int(time.time())
+        with self._lock:
+            gone = {}
+            for path, identity in list(self.identities.items()):
+                if path in paths:
+                    if identity.pop('gone', None):
+                        self._dirty = True
+                    continue
+                if 'gone' not in identity:
+                    identity['gone'] = now
+                    self._dirty = True
+                if now - identity['gone'] > GONE_TTL:
+                    del self.identities[path]
+                    self._dirty = True
+                else:
+                    gone.setdefault(identity['size'], []).append(path)
+        if not gone:
+            return {}
+
+        moves = {}
+        for path in paths:
+            if path in self.identities:
+                continue
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            candidates = gone.get(stat.st_size)
+            if not candidates:
+                continue
+            new_id = content_id(path, stat.st_size)
+            for old_path in candidates:
+                if self.identities[old_path]['id'] == new_id:
+                    candidates.remove(old_path)
+                    moves[old_path] = path
+                    with self._lock:
+                        del self.identities[old_path]
+                        self.identities[path] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'id': new_id}
+                        self._dirty = True
+                    break
+        return moves
+
+    def identify(self, paths: Iterable[str]):
+        """Compute content ids for files that are new or changed
+
+        Reads 128 KB of each such file, call it off the main thread.
+        """
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            identity = self.identities.get(path)
+            if identity and identity['size'] == stat.st_size and identity['mtime'] == stat.st_mtime_ns:
+                continue
+            new_id = content_id(path, stat.st_size)
+            if new_id:
+                with self._lock:
+                    self.identities[path] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'id': new_id}
+                    self._dirty = True
+
+    def move_item(self, old_key: str, new_key: str):
+        """Carry an item's refresh state over to a new key"""
+        with self._lock:
+            if old_key in self.entries:
+                self.entries[new_key] = self.entries.pop(old_key)
+                self._dirty = True
+
+    def needs_refresh(self, key: str, signature: str, has_metadata: bool) -> bool:
+        """Return True for new, renamed or changed items and for items
+        without metadata
+
+        Only refreshes that got an answer from the provider are recorded,
+        an item whose lookup failed stays new. When an item has no match
+        the negative cache decides when its lookup is repeated.
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry.get('signature') != signature:
+            return True
+        return not has_metadata
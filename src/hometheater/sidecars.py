@@ -0,0 +1,291 @@
+# sidecars.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Kodi/Jellyfin style metadata stored next to the videos: movie.nfo,
+# tvshow.nfo and <episode>.nfo files plus poster and fanart images. They
+# are mapped to the same metadata entries the online providers produce,
+# with 'source' set to 'nfo' so they are not replaced by a refresh. The
+# NFO's mtime is kept in the entry, an NFO is only read again after it
+# changed.
+import os
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional
+
+POSTER_NAMES = ('poster.jpg', 'poster.png', 'folder.jpg', 'folder.png', 'cover.jpg')
+FANART_NAMES = ('fanart.jpg', 'fanart.png')
+
+# Root elements of the NFO kinds that are understood
+NFO_ROOTS = ('movie', 'tvshow', 'episodedetails')
+
+
+class _DirListing:
+    """Caches directory listings, so each folder is read once per scan"""
+
+    def __init__(self):
+        self._listings = {}
+
+    def names(self, directory: Path):
+        directory = str(directory)
+        names = self._listings.get(directory)
+        if names is None:
+            try:
+                names = set(os.listdir(directory))
+            except OSError:
+                names = set()
+            self._listings[directory] = names
+        return names
+
+    def find(self, directory: Path, candidates) -> Optional[str]:
+        names = self.names(directory)
+        for name in candidates:
+            if name in names:
+                return str(Path(directory) / name)
+        return None
+
+
+def parse_nfo(path) -> Optional[Dict]:
+    """Parse an NFO file into a metadata entry, or None if it isn't usable
+
+    The file is read with iterparse and elements are dropped as soon as
+    they are handled, so large NFOs with embedded fanart lists or long
+    cast lists don't have to be held in memory as a whole tree.
+    """
+    fields = {}
+    genres, directors, cast = [], [], []
+    cast_images = {}
+    unique_ids = {}
+    root = None
+    depth = 0
+
+    try:
+        for event, elem in ET.iterparse(str(path), events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem.tag
+                    if root not in NFO_ROOTS:
+                        return None
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:
+                # Direct child of the root element
+                text = (elem.text or '').strip()
+                if elem.tag == 'genre' and text:
+                    genres.append(text)
+                elif elem.tag == 'director' and text:
+                    directors.append(text)
+                elif elem.tag == 'actor':
+                    name = (elem.findtext('name') or '').strip()
+                    if name:
+                        cast.append(name)
+                        thumb = (elem.findtext('thumb') or '').strip()
+                        if thumb:
+                            cast_images[name] = thumb
+                elif elem.tag == 'uniqueid' and text:
+                    unique_ids[elem.get('type', 'unknown')] = text
+                elif elem.tag == 'ratings':
+                    value = elem.findtext('rating/value')
+                    if value and 'rating' not in fields:
+                        fields['rating'] = value.strip()
+                elif text and elem.tag not in fields:
+                    fields[elem.tag] = text
+                elem.clear()
+    except (OSError, ET.ParseError) as e:
+        print(f"Error reading {path}: {e}")
+        return None
+
+    title = fields.get('title')
+    if not title:
+        return None
+
+    year = fields.get('year') or fields.get('premiered', '')[:4]
+    metadata = {
+        'title': title,
+        'year': year,
+        'rating': fields.get('rating'),
+        'plot': fields.get('plot') or fields.get('outline', ''),
+        'source': 'nfo',
+    }
+
+    if root == 'episodedetails':
+        metadata.update({
+            'air_date': fields.get('aired', ''),
+            'is_episode': True,
+            'type': 'episode',
+        })
+        for field in ('season', 'episode'):
+            if fields.get(field, '').isdigit():
+                metadata[field] = int(fields[field])
+        return metadata
+
+    metadata.update({
+        'genres': genres,
+        'cast': cast[:5],
+        'type': 'movie' if root == 'movie' else 'show',
+    })
+    if root == 'movie':
+        metadata.update({
+            'director': directors,
+            'cast_images': {},
+            'director_images': {},
+            'cast_bios': {},
+            'director_bios': {},
+        })
+        imdb_id = unique_ids.get('imdb') or fields.get('id', '')
+        if imdb_id.startswith('tt'):
+            metadata['imdb_id'] = imdb_id
+    elif unique_ids.get('tvmaze'):
+        metadata['tvmaze_id'] = unique_ids['tvmaze']
+
+    # Only local actor images, remote thumbs are left to the providers
+    base = Path(path).parent
+    for name, thumb in cast_images.items():
+        image = base / thumb
+        if name in metadata['cast'] and not thumb.startswith(('http://', 'https://')) and image.is_file():
+            metadata.setdefault('cast_images', {})[name] = str(image)
+
+    return metadata
+
+
+def _nfo_mtime(nfo: str) -> Optional[int]:
+    try:
+        return os.stat(nfo).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _wants_sidecar(existing: Optional[Dict], nfo_mtime: Optional[int]) -> bool:
+    """Sidecars fill in items without metadata and keep their own up to date"""
+    if not existing or not existing.get('title') or existing.get('source') == 'embedded':
+        return True
+    return existing.get('source') == 'nfo' and existing.get('nfo_mtime') != nfo_mtime
+
+
+def _read_nfo(nfo: Optional[str], existing: Optional[Dict]) -> Optional[Dict]:
+    """Parse an NFO if the item wants it, with its mtime recorded"""
+    if not nfo:
+        return None
+    mtime = _nfo_mtime(nfo)
+    if not _wants_sidecar(existing, mtime):
+        return None
+    metadata = parse_nfo(nfo)
+    if metadata is not None:
+        metadata['nfo_mtime'] = mtime
+    return metadata
+
+
+def _merge_sidecar(existing: Optional[Dict], sidecar: Dict) -> Dict:
+    """Apply a changed NFO over the entry it made before, keeping the ids,
+    images and bios that a refresh added since"""
+    if not existing or existing.get('source') != 'nfo':
+        return sidecar
+    merged = dict(existing)
+    for field, value in sidecar.items():
+        if isinstance(value, dict) and isinstance(existing.get(field), dict):
+            merged[field] = {**existing[field], **value}
+        else:
+            merged[field] = value
+    return merged
+
+
+def _movie_sidecars(listing: _DirListing, path: Path, own_folder: bool,
+                    existing: Optional[Dict]) -> Optional[Dict]:
+    directory = path.parent
+    stem = path.stem
+
+    candidates = [f"{stem}.nfo"]
+    if own_folder:
+        candidates.append('movie.nfo')
+    metadata = _read_nfo(listing.find(directory, candidates), existing)
+
+    poster_names = [f"{stem}-poster.jpg", f"{stem}-poster.png"]
+    fanart_names = [f"{stem}-fanart.jpg", f"{stem}-fanart.png"]
+    if own_folder:
+        poster_names += POSTER_NAMES
+        fanart_names += FANART_NAMES
+    poster = listing.find(directory, poster_names)
+    fanart = listing.find(directory, fanart_names)
+
+    if metadata is None:
+        if not poster:
+            return None
+        metadata = {}
+    if poster:
+        metadata['poster'] = poster
+    if fanart:
+        metadata['fanart'] = fanart
+    return metadata
+
+
+def read_sidecars(videos_dir: Path, movie_files: List[str], show_files: Dict,
+                  metadata: Dict) -> Dict[str, Dict]:
+    """Return metadata entries built from sidecar files, keyed like metadata.json
+
+    Items that already have metadata from a provider or the user only get
+    a sidecar poster if they have none, items from an NFO are only updated
+    when the NFO changed. Everything is local file access, call this from
+    the scanning thread.
+    """
+    listing = _DirListing()
+    updates = {}
+    movies_root = Path(videos_dir) / "Movies"
+
+    for movie_file in movie_files:
+        path = Path(movie_file)
+        existing = metadata.get(movie_file)
+        own_folder = path.parent != movies_root
+        sidecar = _movie_sidecars(listing, path, own_folder, existing)
+        if not sidecar:
+            continue
+        if sidecar.get('title'):
+            updates[movie_file] = _merge_sidecar(existing, sidecar)
+        elif sidecar.get('poster') and not (existing or {}).get('poster'):
+            updates[movie_file] = dict(existing or {}, poster=sidecar['poster'])
+
+    shows_root = Path(videos_dir) / "Shows"
+    for show_name, seasons in show_files.items():
+        show_dir = shows_root / show_name
+        key = f"show:{show_name}"
+        existing = metadata.get(key)
+
+        show_metadata = _read_nfo(listing.find(show_dir, ('tvshow.nfo',)), existing)
+        poster = listing.find(show_dir, POSTER_NAMES)
+        if show_metadata:
+            if poster:
+                show_metadata['poster'] = poster
+            fanart = listing.find(show_dir, FANART_NAMES)
+            if fanart:
+                show_metadata['fanart'] = fanart
+            updates[key] = _merge_sidecar(existing, show_metadata)
+        elif poster and not (existing or {}).get('poster'):
+            updates[key] = dict(existing or {}, poster=poster)
+
+        for season_num, episodes in seasons.items():
+            for episode_file in episodes:
+                path = Path(episode_file)
+                existing = metadata.get(episode_file)
+                episode_metadata = _read_nfo(listing.find(path.parent, (f"{path.stem}.nfo",)), existing)
+                if episode_metadata and episode_metadata.get('type') == 'episode':
+                    episode_metadata['season'] = season_num
+                    episode_metadata['show_name'] = show_name
+                    updates[episode_file] = _merge_sidecar(existing, episode_metadata)
+
+    return updates
@@ -0,0 +1,167 @@
+# startup.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# This module is imported before anything else in the package, keep it
+# free of gi and other heavy imports.
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Phases in launch order, a launch is complete once all of them are marked
+PHASES = [
+    'interpreter',
+    'imports',
+    'activate',
+    'setup_directories',
+    'metadata',
+    'scan',
+    'release_names',
+    'populate_ui',
+    'first_frame',
+    'first_poster',
+]
+
+MAX_LOG_ENTRIES = 200
+
+
+def _process_start_time() -> Optional[float]:
+    """When the process was started, in seconds of CLOCK_BOOTTIME
+
+    /proc/self/stat gives the start in clock ticks since boot. The boot
+    time clock counts from the same point and isn't moved by clock
+    adjustments, unlike adding the ticks to the wall clock boot time.
+    """
+    try:
+        with open('/proc/self/stat') as f:
+            # The command name may contain spaces, fields start after ')'
+            fields = f.read().rsplit(')', 1)[1].split()
+        start_ticks = int(fields[19])
+        return start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def default_log_path() -> Path:
+    xdg_cache = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    return Path(xdg_cache) / 'hometheater' / 'startup.log'
+
+
+class StartupTracer:
+    """Records when each startup phase finished, in ms since process start"""
+
+    def __init__(self, log_path: Optional[Path] = None):
+        self.log_path = log_path or default_log_path()
+        start = _process_start_time() if hasattr(time, 'CLOCK_BOOTTIME') else None
+        if start is not None:
+            self._clock = lambda: time.clock_gettime(time.CLOCK_BOOTTIME)
+            self.origin = start
+        else:
+            # Without /proc, phases count from when this module was imported
+            self._clock = time.monotonic
+            self.origin = self._clock()
+        self.marks = {}
+        self.finished = False
+        self._lock = threading.Lock()
+
+    def mark(self, phase: str):
+        """Record the end of a phase, only the first mark of a phase counts"""
+        with self._lock:
+            if self.finished or phase in self.marks:
+                return
+            self.marks[phase] = (self._clock() - self.origin) * 1000
+            complete = all(p in self.marks for p in PHASES)
+        if complete:
+            self.finish()
+
+    def finish(self):
+        """Append this launch to the rolling log"""
+        with self._lock:
+            if self.finished or not self.marks:
+                return
+            self.finished = True
+            entry = {'time': int(time.time()), 'phases': dict(self.marks)}
+
+        try:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            entries = read_log(self.log_path)[-(MAX_LOG_ENTRIES - 1):]
+            entries.append(entry)
+            tmp_path = self.log_path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                for item in entries:
+                    f.write(json.dumps(item) + '\n')
+            os.replace(tmp_path, self.log_path)
+        except OSError as e:
+            print(f"Error writing startup log: {e}")
+
+
+def read_log(log_path: Path) -> List[Dict]:
+    entries = []
+    try:
+        with open(log_path) as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except OSError:
+        pass
+    return entries
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    values = sorted(values)
+    index = (len(values) - 1) * pct / 100
+    lower = int(index)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (index - lower)
+
+
+def format_summary(entries: List[Dict]) -> str:
+    """Percentiles per phase over the given launches, as a text table"""
+    if not entries:
+        return "No startup timings recorded yet"
+
+    lines = [
+        f"Startup timings over the last {len(entries)} launches (ms since process start)",
+        f"{'phase':<20}{'n':>5}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}",
+    ]
+    for phase in PHASES:
+        values = [e['phases'][phase] for e in entries if phase in e.get('phases', {})]
+        if not values:
+            continue
+        lines.append(
+            f"{phase:<20}{len(values):>5}"
+            f"{_percentile(values, 50):>10.1f}{_percentile(values, 90):>10.1f}"
+            f"{_percentile(values, 99):>10.1f}{max(values):>10.1f}"
+        )
+    return '\n'.join(lines)
+
+
+def print_report(last: int, log_path: Optional[Path] = None):
+    entries = read_log(log_path or default_log_path())
+    if last > 0:
+        entries = entries[-last:]
+    print(format_summary(entries))
+
+
+tracer = StartupTracer()
+tracer.mark('interpreter')
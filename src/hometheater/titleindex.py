@@ -0,0 +1,278 @@
+# titleindex.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+# Offline title matching from the IMDb non-commercial datasets
+# (https://developer.imdb.com/non-commercial-datasets/). The dumps are
+# streamed into an SQLite file keyed by normalized title, so cleaned file
+# names resolve to IMDb ids without a search request and only the detail
+# page of the final id has to be fetched.
+#
+# This module only uses the standard library, so tools/import-imdb-dataset
+# can load it without the rest of the application.
+import os
+import csv
+import gzip
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+INDEX_VERSION = 1
+
+# Title types worth matching against, shorts, games and episodes are left out
+TITLE_KINDS = ('movie', 'tvMovie', 'video', 'tvSpecial', 'tvSeries', 'tvMiniSeries')
+MOVIE_KINDS = ('movie', 'tvMovie', 'video', 'tvSpecial')
+SHOW_KINDS = ('tvSeries', 'tvMiniSeries')
+
+BATCH_SIZE = 10000
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE titles (
+    tconst INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    year INTEGER,
+    kind TEXT NOT NULL,
+    votes INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE names (norm TEXT NOT NULL, tconst INTEGER NOT NULL);
+CREATE TABLE episodes (
+    parent INTEGER NOT NULL,
+    season INTEGER NOT NULL,
+    episode INTEGER NOT NULL,
+    tconst INTEGER NOT NULL,
+    PRIMARY KEY (parent, season, episode)
+) WITHOUT ROWID;
+"""
+
+INDEXES = """
+CREATE INDEX names_norm ON names (norm);
+"""
+
+
+def normalize(title: str) -> str:
+    """Lowercase title tokens without accents or punctuation
+
+    'Amélie', 'AMELIE' and 'Amelie!' all become 'amelie', '&' is read as
+    'and' so 'Fast & Furious' matches 'Fast and Furious'.
+    """
+    title = unicodedata.normalize('NFKD', title)
+    title = ''.join(c for c in title if not unicodedata.combining(c))
+    title = title.lower().replace('&', ' and ')
+    tokens = ''.join(c if c.isalnum() else ' ' for c in title).split()
+    return ' '.join(tokens)
+
+
+def _tconst(value: str) -> int:
+    # 'tt0111161' is stored as 111161, which keeps the file small
+    return int(value[2:])
+
+
+def _id(tconst: int) -> str:
+    return f"tt{tconst:07d}"
+
+
+def _rows(path):
+    """Yield the rows of a gzipped or plain IMDb TSV file as dicts"""
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        # The dumps don't quote fields, quotes are part of titles
+        yield from csv.DictReader(f, delimiter='\t', quoting=csv.QUOTE_NONE)
+
+
+def _int(value) -> Optional[int]:
+    # Missing values are written as \N
+    return int(value) if value and value.isdigit() else None
+
+
+def import_dataset(index_path, basics_path, episode_path=None, ratings_path=None,
+                   progress: Optional[Callable[[str, int], None]] = None):
+    """Build the index from the dataset dumps
+
+    title.basics is required, title.ratings is used to rank titles that
+    share a name and title.episode to map episodes to their ids. The index
+    is written next to index_path and swapped in when complete, so an
+    interrupted import leaves the previous index in place.
+    """
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_suffix('.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        conn.executescript(SCHEMA)
+
+        kinds = set(TITLE_KINDS)
+        titles, names = [], []
+        count = 0
+        for row in _rows(basics_path):
+            if row['titleType'] not in kinds or row['isAdult'] == '1':
+                continue
+            tconst = _tconst(row['tconst'])
+            titles.append((tconst, row['primaryTitle'], _int(row['startYear']), row['titleType']))
+            primary = normalize(row['primaryTitle'])
+            names.append((primary, tconst))
+            original = normalize(row['originalTitle'])
+            if original and original != primary:
+                names.append((original, tconst))
+            count += 1
+            if len(titles) >= BATCH_SIZE:
+                conn.executemany('INSERT INTO titles (tconst, title, year, kind) VALUES (?, ?, ?, ?)', titles)
+                conn.executemany('INSERT INTO names VALUES (?, ?)', names)
+                titles, names = [], []
+                if progress:
+                    progress('titles', count)
+        conn.executemany('INSERT INTO titles (tconst, title, year, kind) VALUES (?, ?, ?, ?)', titles)
+        conn.executemany('INSERT INTO names VALUES (?, ?)', names)
+        if progress:
+            progress('titles', count)
+
+        if ratings_path:
+            count = 0
+            batch = []
+            for row in _rows(ratings_path):
+                batch.append((int(row['numVotes']), _tconst(row['tconst'])))
+                count += 1
+                if len(batch) >= BATCH_SIZE:
+                    conn.executemany('UPDATE titles SET votes = ? WHERE tconst = ?', batch)
+                    batch = []
+                    if progress:
+                        progress('ratings', count)
+            conn.executemany('UPDATE titles SET votes = ? WHERE tconst = ?', batch)
+            if progress:
+                progress('ratings', count)
+
+        if episode_path:
+            count = 0
+            batch = []
+            for row in _rows(episode_path):
+                season, episode = _int(row['seasonNumber']), _int(row['episodeNumber'])
+                if season is None or episode is None:
+                    continue
+                batch.append((_tconst(row['parentTconst']), season, episode, _tconst(row['tconst'])))
+                count += 1
+                if len(batch) >= BATCH_SIZE:
+                    conn.executemany('INSERT OR IGNORE INTO episodes VALUES (?, ?, ?, ?)', batch)
+                    batch = []
+                    if progress:
+                        progress('episodes', count)
+            conn.executemany('INSERT OR IGNORE INTO episodes VALUES (?, ?, ?, ?)', batch)
+            if progress:
+                progress('episodes', count)
+
+        conn.executescript(INDEXES)
+        conn.executemany('INSERT INTO meta VALUES (?, ?)',
+                         [('version', str(INDEX_VERSION)), ('imported_at', str(int(time.time())))])
+        conn.commit()
+        conn.execute('VACUUM')
+    finally:
+        conn.close()
+    os.replace(tmp_path, index_path)
+
+
+class TitleIndex:
+    """Read-only lookups in an index built by import_dataset
+
+    Each thread gets its own connection, the refresh worker and the
+    background revalidation may query at the same time.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._available = None
+
+    @property
+    def available(self) -> bool:
+        """Whether an index was imported, checked once"""
+        if self._available is None:
+            self._available = self._connection() is not None
+        return self._available
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None and self.path.exists():
+            try:
+                conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+                row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+                if not row or int(row[0]) != INDEX_VERSION:
+                    conn.close()
+                    return None
+            except sqlite3.Error as e:
+                print(f"Error opening title index: {e}")
+                return None
+            self._local.conn = conn
+        return conn
+
+    def lookup(self, title: str, year=None, kinds: Iterable[str] = MOVIE_KINDS) -> Optional[str]:
+        """Return the IMDb id for a title, or None if no title matches
+
+        Among titles with the same name the one released in the given year
+        wins, a year off by one (festival vs. theatrical release) comes
+        next, then the one with the most votes.
+        """
+        norm = normalize(title)
+        if not norm or not self.available:
+            return None
+        kinds = tuple(kinds)
+        try:
+            rows = self._connection().execute(
+                f"SELECT titles.tconst, year, votes FROM names JOIN titles USING (tconst) "
+                f"WHERE norm = ? AND kind IN ({','.join('?' * len(kinds))})",
+                (norm, *kinds)).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error looking up {title} in title index: {e}")
+            return None
+        if not rows:
+            return None
+
+        year = int(year) if year else None
+
+        def rank(row):
+            tconst, row_year, votes = row
+            if year is None or row_year is None:
+                distance = 2
+            else:
+                distance = min(abs(row_year - year), 2)
+            return (distance, -votes)
+
+        best = min(rows, key=rank)
+        # With a year given, a title from a different decade is not a match
+        if year is not None and best[1] is not None and abs(best[1] - year) > 1:
+            return None
+        return _id(best[0])
+
+    def episode(self, show_id: str, season: int, episode: int) -> Optional[str]:
+        """Return the IMDb id of an episode of a show"""
+        if not self.available:
+            return None
+        try:
+            row = self._connection().execute(
+                "SELECT tconst FROM episodes WHERE parent = ? AND season = ? AND episode = ?",
+                (_tconst(show_id), season, episode)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error looking up episode in title index: {e}")
+            return None
+        return _id(row[0]) if row else None
@@ -1,23 +1,27 @@
-import requests
+from . import network
+from .cancellation import Cancelled
 from pathlib import Path
 from typing import Dict, List, Optional
 import json
 
 class TVMaze:
     def __init__(self):
-        self.base_url = "https://api.tvmaze.com"
+        self.base_url = network.provider_url('tvmaze', "https://api.tvmaze.com")
         self.headers = {
             'User-Agent': 'HomeTheater/1.0 (https://github.com/koyu/hometheater)',
             'Accept': 'application/json'
         }
+        # FetchStats and CancellationToken of the running refresh, if any
+        self.stats = None
+        self.token = None
 
-    def search_tv(self, query: str) -> List[Dict]:
-        """Search for TV shows"""
+    def search_tv(self, query: str) -> Optional[List[Dict]]:
+        """Search for TV shows, returns None if the search failed"""
         url = f"{self.base_url}/search/shows"
         params = {'q': query}
         
         try:
-            response = requests.get(url, params=params, headers=self.headers)
+            response = network.get('tvmaze', url, params=params, headers=self.headers, stats=self.stats, token=self.token)
             response.raise_for_status()
             results = response.json()
             
@@ -32,22 +36,24 @@ class TVMaze:
                 })
             return cleaned_results
             
+        except Cancelled:
+            raise
         except Exception as e:
             print(f"Error searching shows: {e}")
-            return []
+            return None
 
     def get_show(self, show_id: str) -> Optional[Dict]:
         """Get detailed show information"""
         try:
             # Get main show info
             show_url = f"{self.base_url}/shows/{show_id}"
-            show_response = requests.get(show_url, headers=self.headers)
+            show_response = network.get('tvmaze', show_url, headers=self.headers, stats=self.stats, token=self.token)
             show_response.raise_for_status()
             show = show_response.json()
             
             # Get cast info
             cast_url = f"{self.base_url}/shows/{show_id}/cast"
-            cast_response = requests.get(cast_url, headers=self.headers)
+            cast_response = network.get('tvmaze', cast_url, headers=self.headers, stats=self.stats, token=self.token)
             cast_response.raise_for_status()
             cast_data = cast_response.json()
             
@@ -71,16 +77,19 @@ class TVMaze:
                 'rating': str(show.get('rating', {}).get('average', '')) if show.get('rating') else None
             }
             
+        except Cancelled:
+            raise
         except Exception as e:
             print(f"Error fetching show data: {e}")
             return None
 
-    def get_season(self, show_id: str, season_number: int) -> Dict:
-        """Get episode information for a specific season"""
+    def get_season(self, show_id: str, season_number: int) -> Optional[Dict]:
+        """Get episode information for a specific season, returns None if
+        the request failed"""
         try:
             # Get all episodes
             url = f"{self.base_url}/shows/{show_id}/episodes"
-            response = requests.get(url, headers=self.headers)
+            response = network.get('tvmaze', url, headers=self.headers, stats=self.stats, token=self.token)
             response.raise_for_status()
             all_episodes = response.json()
             
@@ -113,9 +122,11 @@ class TVMaze:
                 'episodes': sorted(cleaned_episodes, key=lambda x: x['episode_number'] or 0)
             }
             
+        except Cancelled:
+            raise
         except Exception as e:
             print(f"Error fetching season data: {e}")
-            return {'season_number': season_number, 'episodes': []}
+            return None
 
     def download_image(self, url: str, save_path: str) -> Optional[str]:
         """Download and save an image from URL"""
@@ -123,12 +134,14 @@ class TVMaze:
             return None
             
         try:
-            response = requests.get(url, headers=self.headers)
+            response = network.get('tvmaze', url, headers=self.headers, stats=self.stats, token=self.token)
             if response.status_code == 200:
                 save_path = Path(save_path)
                 save_path.parent.mkdir(parents=True, exist_ok=True)
                 save_path.write_bytes(response.content)
                 return str(save_path)
+        except Cancelled:
+            raise
         except Exception as e:
             print(f"Error downloading image: {e}")
         return None
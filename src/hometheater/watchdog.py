@@ -0,0 +1,159 @@
+# watchdog.py
+#
+# Copyright 2025 koyu.space
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import sys
+import time
+import threading
+from collections import Counter
+from pathlib import Path
+from gi.repository import GLib
+
+PACKAGE_DIR = str(Path(__file__).parent)
+
+
+class StallSite:
+    """Aggregated stalls attributed to one call site"""
+
+    def __init__(self, key):
+        self.key = key
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, duration_ms):
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+
+class MainLoopWatchdog:
+    """Detects main loop iterations blocked longer than a threshold
+
+    A high priority timeout on the main loop updates a heartbeat. A helper
+    thread checks the heartbeat and, while it is late, samples the main
+    thread's Python stack. Each stall is attributed to the call site seen
+    most often while it lasted.
+    """
+
+    def __init__(self, threshold_ms=50, beat_ms=10):
+        self.threshold = threshold_ms / 1000
+        self.beat_ms = beat_ms
+        self.sites = {}
+        self._main_ident = threading.main_thread().ident
+        self._last_beat = time.monotonic()
+        self._timeout_id = None
+        self._thread = None
+        self._running = False
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start watching, must be called from the main thread"""
+        if self._running:
+            return
+        self._running = True
+        self._last_beat = time.monotonic()
+        self._timeout_id = GLib.timeout_add(self.beat_ms, self._beat, priority=GLib.PRIORITY_HIGH)
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+            self._timeout_id = None
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+        return self._running
+
+    def _watch(self):
+        samples = Counter()
+        stall_start = None
+        interval = min(self.threshold / 4, 0.01)
+
+        while self._running:
+            time.sleep(interval)
+            last_beat = self._last_beat
+            blocked = time.monotonic() - last_beat
+
+            if blocked > self.threshold:
+                stall_start = last_beat
+                frame = sys._current_frames().get(self._main_ident)
+                if frame is not None:
+                    samples[self._call_site(frame)] += 1
+            elif stall_start is not None:
+                # The loop ran again, the stall lasted until the next beat
+                duration_ms = (last_beat - stall_start) * 1000
+                key = samples.most_common(1)[0][0] if samples else "<unknown>"
+                self._record(key, duration_ms)
+                samples.clear()
+                stall_start = None
+
+    def _call_site(self, frame):
+        """Describe the innermost application frame and what it was calling"""
+        innermost = None
+        app_frame = None
+        while frame is not None:
+            code = frame.f_code
+            site = f"{os.path.basename(code.co_filename)}:{frame.f_lineno} in {code.co_name}"
+            if innermost is None:
+                innermost = site
+            if code.co_filename.startswith(PACKAGE_DIR):
+                app_frame = site
+                break
+            frame = frame.f_back
+
+        if app_frame is None:
+            return innermost
+        if app_frame == innermost:
+            return app_frame
+        return f"{app_frame} -> {innermost}"
+
+    def _record(self, key, duration_ms):
+        with self._lock:
+            site = self.sites.get(key)
+            if site is None:
+                site = self.sites[key] = StallSite(key)
+            site.add(duration_ms)
+
+    def report(self):
+        """Return the stalls seen so far, worst call sites first"""
+        with self._lock:
+            sites = sorted(self.sites.values(), key=lambda s: s.total_ms, reverse=True)
+
+        if not sites:
+            return f"No main loop stalls over {self.threshold * 1000:.0f} ms recorded"
+
+        lines = [
+            f"Main loop stalls over {self.threshold * 1000:.0f} ms",
+            f"{'count':>6}{'total ms':>11}{'max ms':>10}  call site",
+        ]
+        for site in sites:
+            lines.append(f"{site.count:>6}{site.total_ms:>11.0f}{site.max_ms:>10.0f}  {site.key}")
+        return '\n'.join(lines)
+
+    def dump(self, path):
+        """Write the report to a file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.report() + '\n')
+        return str(path)
@@ -1,4 +1,4 @@
-import requests
+from . import network
 from typing import Dict, List, Optional
 from pathlib import Path
 import re
@@ -14,6 +14,10 @@ class Wikipedia:
         self.headers = {
             'User-Agent': self.USER_AGENT
         }
+        self.base_url = network.provider_url('wikipedia', self.BASE_URL)
+        # FetchStats and CancellationToken of the running refresh, if any
+        self.stats = None
+        self.token = None
 
     def _clean_name(self, title: str) -> str:
         """Clean up article title to get just the person's name"""
@@ -53,16 +57,20 @@ class Wikipedia:
         
         return any(re.search(marker, text, re.IGNORECASE) for marker in markers)
 
-    def search_person(self, name: str) -> Optional[Dict]:
+    def search_person(self, name: str, stats=None, token=None) -> Optional[Dict]:
         """
         Search for a person on Wikipedia
         
         Args:
             name: Name of the person to search for
+            stats: FetchStats for this search, the refresh's by default
+            token: CancellationToken for this search, the refresh's by default
             
         Returns:
             Dictionary containing person info or None if not found
         """
+        stats = self.stats if stats is None else stats
+        token = self.token if token is None else token
         # Search Wikipedia API with specific search terms
         params = {
             "action": "query",
@@ -72,7 +80,8 @@ class Wikipedia:
             "srlimit": 10  # Get more results to filter
         }
 
-        response = requests.get(self.BASE_URL, params=params, headers=self.headers)
+        response = network.get('wikipedia', self.base_url, params=params, headers=self.headers, stats=stats, token=token)
+        response.raise_for_status()
         data = response.json()
 
         if not data.get("query", {}).get("search"):
@@ -124,7 +133,8 @@ class Wikipedia:
             "pageids": best_result["pageid"]
         }
 
-        response = requests.get(self.BASE_URL, params=params, headers=self.headers)
+        response = network.get('wikipedia', self.base_url, params=params, headers=self.headers, stats=stats, token=token)
+        response.raise_for_status()
         data = response.json()
         page = data["query"]["pages"][str(best_result["pageid"])]
         
@@ -19,23 +19,37 @@
 
 import os
 import json
-import requests
 import subprocess
 from pathlib import Path
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Adw, Gtk, Gio, GLib, GdkPixbuf, Pango, Gdk
+from gi.repository import Adw, Gtk, Gio, GLib, GObject, GdkPixbuf, Pango, Gdk
 from gettext import gettext as _
-from hometheater.imdb import IMDb
-from hometheater.tvmaze import TVMaze
 from .item import HomeTheaterItem
-from .player import HomeTheaterPlayer
 from .episodes import EpisodesUI
-from .wikipedia import Wikipedia
-import re
+from .library import (LibrarySnapshot, build_library, choose_version, is_matched,
+                      load_metadata, release_info, scan_library)
+from .releasename import episode_number
+from .sidecars import read_sidecars
+from .embedded import EmbeddedTagCache
+from .startup import tracer
+from .watchdog import MainLoopWatchdog
+from .dispatcher import MainLoopDispatcher
+from .refreshqueue import (RefreshQueue, PRIORITY_OPEN, PRIORITY_VISIBLE,
+                           PRIORITY_NEXT_SCREEN)
+from .cancellation import Cancelled, CancellationToken
+from .scanindex import ScanIndex, movie_signature, show_signature
+from .negativecache import NegativeCache
+from .titleindex import TitleIndex
+from . import freshness
+from . import parsing
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Choices of the preferred-version setting, in the order of the combo row
+VERSION_PREFERENCES = ('highest', 'lowest')
 
 @Gtk.Template(resource_path='/space/koyu/hometheater/settings.ui')
 class HomeTheaterPreferencesWindow(Adw.PreferencesWindow):
@@ -47,6 +61,9 @@ class HomeTheaterPreferencesWindow(Adw.PreferencesWindow):
     mal_switch = Gtk.Template.Child()
     wikipedia_switch = Gtk.Template.Child()
     auto_fetch_switch = Gtk.Template.Child()
+    revalidate_budget_spin = Gtk.Template.Child()
+    preferred_version_row = Gtk.Template.Child()
+    stall_watchdog_switch = Gtk.Template.Child()
     clear_metadata_button = Gtk.Template.Child()
     clear_cache_button = Gtk.Template.Child()
     
@@ -60,6 +77,10 @@ class HomeTheaterPreferencesWindow(Adw.PreferencesWindow):
         self.mal_switch.set_active(self.settings.get_boolean('use-mal'))
         self.wikipedia_switch.set_active(self.settings.get_boolean('use-wikipedia'))
         self.auto_fetch_switch.set_active(self.settings.get_boolean('auto-fetch'))
+        self.revalidate_budget_spin.set_value(self.settings.get_int('revalidate-budget'))
+        self.preferred_version_row.set_selected(
+            VERSION_PREFERENCES.index(self.settings.get_string('preferred-version')))
+        self.stall_watchdog_switch.set_active(self.settings.get_boolean('stall-watchdog'))
         
         # Connect switch signals
         self.imdb_switch.connect('notify::active', self.on_imdb_switch_active)
@@ -67,6 +88,9 @@ class HomeTheaterPreferencesWindow(Adw.PreferencesWindow):
         self.mal_switch.connect('notify::active', self.on_mal_switch_active)
         self.wikipedia_switch.connect('notify::active', self.on_wikipedia_switch_active)
         self.auto_fetch_switch.connect('notify::active', self.on_auto_fetch_switch_active)
+        self.revalidate_budget_spin.connect('value-changed', self.on_revalidate_budget_changed)
+        self.preferred_version_row.connect('notify::selected', self.on_preferred_version_changed)
+        self.stall_watchdog_switch.connect('notify::active', self.on_stall_watchdog_switch_active)
         
         # Connect button signals using connect_after to ensure template is fully loaded
         self.clear_metadata_button.connect_after('clicked', self.on_clear_metadata_clicked)
@@ -87,6 +111,15 @@ class HomeTheaterPreferencesWindow(Adw.PreferencesWindow):
     def on_auto_fetch_switch_active(self, switch, _):
         self.settings.set_boolean('auto-fetch', switch.get_active())
 
+    def on_revalidate_budget_changed(self, spin):
+        self.settings.set_int('revalidate-budget', spin.get_value_as_int())
+
+    def on_preferred_version_changed(self, row, _):
+        self.settings.set_string('preferred-version', VERSION_PREFERENCES[row.get_selected()])
+
+    def on_stall_watchdog_switch_active(self, switch, _):
+        self.settings.set_boolean('stall-watchdog', switch.get_active())
+
     def on_clear_metadata_clicked(self, button):
         """Handle clear metadata button click"""
         dialog = Adw.MessageDialog.new(
@@ -106,6 +139,8 @@ class HomeTheaterPreferencesWindow(Adw.PreferencesWindow):
                     if window:
                         # Clear metadata dictionary
                         window.metadata = {}
+                        # and the lookups that found nothing, so all are retried
+                        window.negative_cache.clear()
                         # Save empty metadata file
                         window.save_metadata()
                         # Reload library and UI
@@ -185,6 +220,11 @@ class HomeTheaterPreferencesWindow(Adw.PreferencesWindow):
 class HomeTheaterWindow(Adw.ApplicationWindow):
     __gtype_name__ = 'HomeTheaterWindow'
 
+    # Emitted with the metadata key (file path or "show:<name>") that changed
+    __gsignals__ = {
+        'metadata-changed': (GObject.SignalFlags.RUN_FIRST, None, (str,))
+    }
+
     navigation_view = Gtk.Template.Child()
     view_stack = Gtk.Template.Child()
     movies_box = Gtk.Template.Child()
@@ -205,10 +245,26 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
         self.cache_dir = Path(GLib.get_user_cache_dir()) / "hometheater"
         self.videos_dir = Path.home() / "Videos"
         self.metadata_file = self.config_dir / "metadata.json"
-        self.setup_directories()
+        self.snapshot = LibrarySnapshot(self.cache_dir / "library.json")
+        self.dispatcher = MainLoopDispatcher()
         self.setup_actions()
-        self.load_library()
+
+        # Paint the first frame from the last snapshot, the real scan
+        # runs in the background and is reconciled in _apply_library_scan
+        self.metadata = {}
+        self.movies = []
+        self.shows = {}
+        self._releases = {}
+        self.library_loaded = False
+        self._pending_metadata = {}
+        self._movie_cards = {}
+        self._show_cards = {}
+        self._save_timeout_id = None
+        self.load_snapshot()
         self.populate_ui()
+        tracer.mark('populate_ui')
+        self._first_frame_handler = None
+        self.connect('realize', self._on_realize_trace_frame)
         
         # Load CSS
         css_provider = Gtk.CssProvider()
@@ -217,10 +273,6 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
             Gdk.Display.get_default(), css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
         
-        # Check for auto-fetch setting
-        if self.settings.get_boolean('auto-fetch'):
-            GLib.idle_add(self.on_fetch_metadata, None, None)
-        
         # Connect refresh button
         self.refresh_button.connect('clicked', lambda _: self.on_fetch_metadata(None, None))
 
@@ -229,16 +281,95 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
         self.search_entry.connect('search-changed', self.on_search_changed)
         self.search_mode.connect('notify::selected', self.on_search_changed)
 
-        self.wikipedia = Wikipedia() if self.settings.get_boolean('use-wikipedia') else None
+        self.connect('close-request', self._on_close_request)
+
+        # Re-rank a running refresh when what is on screen changes
+        self.view_stack.connect('notify::visible-child', self._schedule_refresh_priorities)
+        self.navigation_view.connect('notify::visible-page', self._schedule_refresh_priorities)
+        for box in (self.movies_box, self.shows_box):
+            scrolled = box.get_ancestor(Gtk.ScrolledWindow)
+            if scrolled:
+                scrolled.get_vadjustment().connect('value-changed', self._schedule_refresh_priorities)
+
+        # Provider clients and their dependencies are loaded on first use
+        self._wikipedia = None
+        self._fetch_stats = None
+        self._fetch_token = None
+        self.refresh_queue = RefreshQueue(self.cache_dir / "refresh-queue.json")
+        self._refresh_running = False
+        self._priorities_timeout_id = None
+        self.scan_index = ScanIndex(self.cache_dir / "scan-index.json")
+        self.negative_cache = NegativeCache(self.cache_dir / "negative-cache.json")
+        # Built by tools/import-imdb-dataset, without it every movie is searched online
+        self.title_index = TitleIndex(self.cache_dir / "imdb-titles.sqlite")
+        self.embedded_tags = EmbeddedTagCache(self.cache_dir / "embedded-tags.json",
+                                              self.cache_dir / "embedded")
+        self._revalidate_source = None
+        self._revalidate_spent = 0
+        self._revalidate_token = None
+        self._image_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='images')
+
+        self.watchdog = None
+        self.settings.connect('changed::stall-watchdog', self._on_stall_watchdog_changed)
+        self._on_stall_watchdog_changed(self.settings, 'stall-watchdog')
+
+        thread = threading.Thread(target=self._scan_library_async)
+        thread.daemon = True
+        thread.start()
+
+    def _on_realize_trace_frame(self, widget):
+        frame_clock = self.get_frame_clock()
+        self._first_frame_handler = frame_clock.connect('after-paint', self._on_first_paint)
+
+    def _on_first_paint(self, frame_clock):
+        tracer.mark('first_frame')
+        frame_clock.disconnect(self._first_frame_handler)
+
+    def _on_close_request(self, window):
+        if self._fetch_token:
+            self._fetch_token.cancel()
+        if self._revalidate_token:
+            self._revalidate_token.cancel()
+        if self._save_timeout_id is not None:
+            GLib.source_remove(self._save_timeout_id)
+            self._flush_save()
+        self.save_snapshot()
+        tracer.finish()
+        if self.watchdog:
+            self.watchdog.dump(self.cache_dir / "stall-report.txt")
+        parsing.shutdown()
+        return False
+
+    def _on_stall_watchdog_changed(self, settings, key):
+        """Start or stop the main loop watchdog to follow the setting"""
+        enabled = settings.get_boolean('stall-watchdog')
+        if enabled and not self.watchdog:
+            self.watchdog = MainLoopWatchdog(settings.get_int('stall-threshold'))
+            self.watchdog.start()
+        elif not enabled and self.watchdog:
+            self.watchdog.stop()
+            self.watchdog = None
+        self.lookup_action('stall-report').set_enabled(enabled)
+
+    @property
+    def wikipedia(self):
+        """Wikipedia client, created the first time it is needed"""
+        if self._wikipedia is None and self.settings.get_boolean('use-wikipedia'):
+            from .wikipedia import Wikipedia
+            self._wikipedia = Wikipedia()
+        return self._wikipedia
 
     def setup_actions(self):
         """Set up window actions"""
         actions = [
             ('fetch-metadata', self.on_fetch_metadata),
+            ('force-fetch-metadata', self.on_force_fetch_metadata),
             ('settings', self.on_settings),
             ('help', self.on_help),
             ('about', self.on_about),
             ('open-folder', self.on_open_folder),
+            ('stall-report', self.on_stall_report),
+            ('retry-lookup', self.on_retry_lookup, 's'),
             ('view-sorting', self.on_view_sorting, 's')
         ]
         
@@ -266,73 +397,340 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
             self.metadata_file.write_text("{}")
 
     def load_library(self):
-        # Load existing metadata
+        """Read metadata.json and rescan the videos folder synchronously"""
+        self.metadata = load_metadata(self.metadata_file)
+        self._movie_files, self._show_files = scan_library(self.videos_dir)
+        self.movies, self.shows = build_library(
+            self.metadata, self._movie_files, self._show_files, self._releases)
+
+    def load_snapshot(self):
+        """Fill the library from the last saved snapshot, if there is one"""
+        snapshot = self.snapshot.load()
+        if not snapshot:
+            self._movie_files, self._show_files = [], {}
+            return False
+        self.metadata, self._movie_files, self._show_files, self._releases = snapshot
+        self.movies, self.shows = build_library(
+            self.metadata, self._movie_files, self._show_files, self._releases)
+        return True
+
+    def save_snapshot(self):
+        """Persist the current library view for the next startup"""
+        if self.library_loaded:
+            self.snapshot.save(self.metadata, self._movie_files, self._show_files, self._releases)
+
+    def _scan_library_async(self):
+        """Scan the disk off the main thread and hand the result back"""
         try:
-            with open(self.metadata_file, 'r') as f:
-                self.metadata = json.load(f)
-        except json.JSONDecodeError:
-            self.metadata = {}
+            self.setup_directories()
+            tracer.mark('setup_directories')
+            metadata = load_metadata(self.metadata_file)
+            tracer.mark('metadata')
+            movie_files, show_files = scan_library(self.videos_dir)
+            tracer.mark('scan')
+            video_files = movie_files + [path for seasons in show_files.values()
+                                         for episodes in seasons.values() for path in episodes]
+            self.scan_index.load()
+            # Moved and renamed files keep their metadata and progress
+            moves = self.scan_index.find_moves(video_files)
+            if moves:
+                self._relink_moved(metadata, moves, show_files)
+            # Local NFO files and posters come before any network lookup
+            metadata.update(read_sidecars(self.videos_dir, movie_files, show_files, metadata))
+            # File names are parsed once, when a file shows up
+            releases = self.scan_index.release_names(video_files)
+            self.scan_index.save()
+            tracer.mark('release_names')
+            self.negative_cache.load()
+            self.snapshot.save(metadata, movie_files, show_files, releases)
+        except Exception as e:
+            # Keep showing the snapshot, library_loaded stays False so the
+            # metadata on disk is never overwritten with a partial library
+            print(f"Error scanning library: {e}")
+            self.dispatcher.call(self._library_scan_failed)
+            return
+        self.dispatcher.call(self._apply_library_scan, metadata, movie_files, show_files, releases)
+        if moves:
+            self.dispatcher.call(self.save_metadata)
+        self._read_embedded_tags(metadata, movie_files, show_files)
+        # Content ids of new files, to recognize them when they move later
+        self.scan_index.identify(video_files)
+        self.scan_index.save()
 
-        # Scan Movies directory
-        movies_path = self.videos_dir / "Movies"
-        self.movies = []
-        for movie_file in movies_path.glob("**/*"):
-            if movie_file.is_file() and movie_file.suffix.lower() in ['.mp4', '.mkv', '.avi', '.webm']:
-                movie_data = {
-                    'path': str(movie_file),
-                    'title': movie_file.stem,
-                    'metadata': self.metadata.get(str(movie_file), {})
-                }
-                self.movies.append(movie_data)
+    def _relink_moved(self, metadata, moves, show_files):
+        """Carry metadata, refresh state and playback positions over to
+        files that were moved or renamed"""
+        episode_shows = {path: show_name for show_name, seasons in show_files.items()
+                         for episodes in seasons.values() for path in episodes}
+        renamed_shows = {}
+        for old_path, new_path in moves.items():
+            if metadata.get(old_path) and not metadata.get(new_path):
+                metadata[new_path] = metadata.pop(old_path)
+            self.scan_index.move_item(old_path, new_path)
 
-        # Scan Shows directory with seasons support
-        shows_path = self.videos_dir / "Shows"
-        self.shows = {}
-        for show_dir in shows_path.iterdir():
-            if show_dir.is_dir():
-                seasons = {}
-                # Look for season directories or episodes
-                for item in show_dir.iterdir():
-                    if item.is_dir() and item.name.lower().startswith("season"):
-                        # This is a season directory
-                        season_num = item.name.lower().replace("season", "").strip()
-                        episodes = []
-                        for episode_file in item.glob("*"):
-                            if episode_file.is_file() and episode_file.suffix.lower() in ['.mp4', '.mkv', '.avi', '.webm']:
-                                episode_data = {
-                                    'path': str(episode_file),
-                                    'title': episode_file.stem,
-                                    'season': season_num,
-                                    'metadata': self.metadata.get(str(episode_file), {})
-                                }
-                                episodes.append(episode_data)
-                        if episodes:
-                            seasons[season_num] = episodes
-                    elif item.is_file() and item.suffix.lower() in ['.mp4', '.mkv', '.avi', '.webm']:
-                        # Episode directly in show directory - assume season 1
-                        if "1" not in seasons:
-                            seasons["1"] = []
-                        episode_data = {
-                            'path': str(item),
-                            'title': item.stem,
-                            'season': "1",
-                            'metadata': self.metadata.get(str(item), {})
-                        }
-                        seasons["1"].append(episode_data)
-                
-                if seasons:
-                    self.shows[show_dir.name] = seasons
+            entry = metadata.get(new_path, {})
+            new_show = episode_shows.get(new_path)
+            if entry.get('is_episode') and new_show and entry.get('show_name') != new_show:
+                renamed_shows.setdefault(new_show, set()).add(entry['show_name'])
+                metadata[new_path] = dict(entry, show_name=new_show)
+
+        # A show folder was renamed if its episodes all came from one
+        # show that is no longer in the library
+        for new_show, old_shows in renamed_shows.items():
+            old_show = old_shows.pop()
+            if old_shows or old_show in show_files or metadata.get(f"show:{new_show}"):
+                continue
+            if f"show:{old_show}" in metadata:
+                metadata[f"show:{new_show}"] = metadata.pop(f"show:{old_show}")
+                self.scan_index.move_item(f"show:{old_show}", f"show:{new_show}")
+
+        timestamps_file = self.config_dir / "timestamps.json"
+        try:
+            with open(timestamps_file, 'r') as f:
+                timestamps = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        moved = {old: new for old, new in moves.items() if old in timestamps and new not in timestamps}
+        if not moved:
+            return
+        for old_path, new_path in moved.items():
+            timestamps[new_path] = timestamps.pop(old_path)
+        try:
+            tmp_path = timestamps_file.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(timestamps, f)
+            os.replace(tmp_path, timestamps_file)
+        except OSError as e:
+            print(f"Error saving timestamps: {e}")
+
+    def _read_embedded_tags(self, metadata, movie_files, show_files):
+        """Give items without metadata the title and cover stored in the file
+
+        Runs on the scanning thread after the library is shown. Files are
+        only opened the first time or after they changed.
+        """
+        updates = {}
+        try:
+            self.embedded_tags.load()
+            episode_files = [path for seasons in show_files.values()
+                             for episodes in seasons.values() for path in episodes]
+            for path in movie_files + episode_files:
+                existing = metadata.get(path) or {}
+                if existing.get('title') and existing.get('source') != 'embedded' and existing.get('poster'):
+                    continue
+                tags = self.embedded_tags.get(path)
+                if not tags:
+                    continue
+                if not existing.get('title') or existing.get('source') == 'embedded':
+                    if tags.get('title'):
+                        entry = {'title': tags['title'], 'year': tags.get('year', ''),
+                                 'source': 'embedded'}
+                        if path in movie_files:
+                            entry['type'] = 'movie'
+                        else:
+                            entry.update({'is_episode': True, 'type': 'episode'})
+                            if tags.get('episode'):
+                                entry['episode'] = tags['episode']
+                        if existing.get('poster') or tags.get('cover'):
+                            entry['poster'] = existing.get('poster') or tags['cover']
+                        if entry != existing:
+                            updates[path] = entry
+                        continue
+                if tags.get('cover') and not existing.get('poster'):
+                    updates[path] = dict(existing, poster=tags['cover'])
+            self.embedded_tags.prune(movie_files + episode_files)
+            self.embedded_tags.save()
+        except Exception as e:
+            print(f"Error reading embedded tags: {e}")
+        if updates:
+            self.dispatcher.call(self._apply_embedded_tags, updates)
+
+    def _apply_embedded_tags(self, updates):
+        for path, entry in updates.items():
+            current = self.metadata.get(path) or {}
+            # A refresh or an edit may have filled the item in meanwhile
+            if is_matched(current) and current.get('poster'):
+                continue
+            if is_matched(current):
+                entry = dict(current, poster=entry.get('poster'))
+            self.update_metadata(path, entry)
+        return False
+
+    def _library_scan_failed(self):
+        toast = Adw.Toast.new(_("Could not scan the videos folder"))
+        toast.set_timeout(3)
+        self.toast_overlay.add_toast(toast)
+        return False
+
+    def _apply_library_scan(self, metadata, movie_files, show_files, releases):
+        """Swap in the scanned library and update only the cards that changed"""
+        # Fields edited while the scan was running win over what is on disk
+        for path, fields in self._pending_metadata.items():
+            metadata[path] = dict(metadata.get(path) or {}, **fields)
+        has_pending = bool(self._pending_metadata)
+        self._pending_metadata = {}
+
+        old_movies, old_shows = self.movies, self.shows
+        old_metadata = self.metadata
+        self.metadata = metadata
+        self._movie_files, self._show_files = movie_files, show_files
+        self._releases = releases
+        self.movies, self.shows = build_library(metadata, movie_files, show_files, releases)
+        self.library_loaded = True
+        if has_pending:
+            self.save_metadata()
+
+        if self.search_entry.get_text():
+            self.on_search_changed()
+        elif bool(old_movies) != bool(self.movies) or bool(old_shows) != bool(self.shows):
+            self.populate_ui()
+        else:
+            self._reconcile_cards(
+                self.movies_box, self._movie_cards,
+                [(m['path'], self._movie_card_args(m)) for m in old_movies],
+                [(m['path'], self._movie_card_args(m)) for m in self.movies])
+            self._reconcile_cards(
+                self.shows_box, self._show_cards,
+                [(n, self._show_card_args(n, s, old_metadata)) for n, s in old_shows.items()],
+                [(n, self._show_card_args(n, s, self.metadata)) for n, s in self.shows.items()])
+
+        if self.settings.get_boolean('auto-fetch'):
+            self.on_fetch_metadata(None, None, delta=True)
+        self._schedule_revalidation()
+        return False
+
+    def _reconcile_cards(self, box, cards, old_items, new_items):
+        """Apply the difference between two (key, card args) lists to a grid"""
+        old = {key: self._card_signature(*args) for key, args in old_items}
+        new_keys = {key for key, _ in new_items}
+
+        for key in old:
+            if key not in new_keys and key in cards:
+                box.remove(cards.pop(key))
+
+        for position, (key, args) in enumerate(new_items):
+            if key in old and key in cards and old[key] == self._card_signature(*args):
+                continue
+            if key in cards:
+                box.remove(cards.pop(key))
+            card = self._create_poster_card(*args)
+            box.insert(card, position)
+            cards[key] = card
+
+    def _card_signature(self, title, metadata, on_click, is_show=False, key=None):
+        return (title, metadata.get('poster'), is_show)
+
+    def _movie_card_args(self, movie):
+        title = movie.get('metadata', {}).get('title', movie['title'])
+        # Look the entry up on click so cards kept across a reconcile
+        # never open stale snapshot data
+        return (title, movie.get('metadata', {}),
+                lambda _, p=movie['path']: self._show_movie_by_path(p),
+                False, movie['path'])
+
+    def _show_card_args(self, show_name, seasons, metadata):
+        show_metadata = metadata.get(f"show:{show_name}", {})
+        if not show_metadata:
+            first_season = next(iter(seasons.values()))
+            show_metadata = first_season[0].get('metadata', {})
+        return (show_name, show_metadata,
+                lambda _, s=show_name: self.show_episodes(s, self.shows[s]),
+                True, f"show:{show_name}")
+
+    def _show_movie_by_path(self, path):
+        movie = next((m for m in self.movies if m['path'] == path), None)
+        if movie:
+            self.show_movie_details(movie)
 
     def save_metadata(self):
+        if not self.library_loaded:
+            # Only the snapshot is in memory, don't overwrite the real file
+            return
         with open(self.metadata_file, 'w') as f:
             json.dump(self.metadata, f, indent=2)
+        # The refresh checkpoint is only ever as far as the saved metadata
+        if self.refresh_queue.jobs:
+            self.refresh_queue.save()
+        self.scan_index.save()
+        self.negative_cache.save()
 
     def update_metadata(self, file_path, metadata):
+        """Store the metadata for one key and re-render only what shows it"""
+        if not self.library_loaded:
+            # Only the compact snapshot entry is known yet, keep just the
+            # edited fields to merge into the full entry after the scan
+            previous = self.metadata.get(file_path) or {}
+            changed = {key: value for key, value in metadata.items() if previous.get(key) != value}
+            self._pending_metadata.setdefault(file_path, {}).update(changed)
         self.metadata[file_path] = metadata
+        if not self.library_loaded:
+            return
+        entry = self._find_entry(file_path)
+        if entry is not None:
+            entry['metadata'] = metadata
+        self._schedule_save()
+        self.emit('metadata-changed', file_path)
+
+    def _find_entry(self, file_path):
+        """Return the movie or episode entry for a path, if it is in the library"""
+        for movie in self.movies:
+            if movie['path'] == file_path:
+                return movie
+        for seasons in self.shows.values():
+            for episodes in seasons.values():
+                for episode in episodes:
+                    if episode['path'] == file_path:
+                        return episode
+        return None
+
+    def _schedule_save(self):
+        """Write metadata.json once a burst of changes has settled"""
+        if self._save_timeout_id is None:
+            self._save_timeout_id = GLib.timeout_add(500, self._flush_save)
+
+    def _flush_save(self):
+        self._save_timeout_id = None
         self.save_metadata()
-        # Reload library and update UI
-        self.load_library()
-        self.populate_ui()
+        return False
+
+    def do_metadata_changed(self, key):
+        """Replace the grid card that shows the changed key"""
+        if self.search_entry.get_text():
+            # The change can move the item in or out of the results
+            self.on_search_changed()
+            return
+        if key.startswith("show:"):
+            show_name = key[len("show:"):]
+        else:
+            show_name = next(
+                (name for name, seasons in self.shows.items()
+                 if any(e['path'] == key for eps in seasons.values() for e in eps)),
+                None)
+
+        if show_name is not None:
+            if show_name in self._show_cards and show_name in self.shows:
+                self._replace_card(self.shows_box, self._show_cards, show_name,
+                                   self._show_card_args(show_name, self.shows[show_name], self.metadata))
+        elif key in self._movie_cards:
+            movie = self._find_entry(key)
+            if movie is not None:
+                self._replace_card(self.movies_box, self._movie_cards, key,
+                                   self._movie_card_args(movie))
+
+    def _replace_card(self, box, cards, key, args):
+        old_card = cards[key]
+        position = old_card.get_parent().get_index()
+        box.remove(old_card)
+        card = self._create_poster_card(*args)
+        box.insert(card, position)
+        cards[key] = card
+
+    def _local_poster(self, metadata):
+        """Return the entry's poster if it is a sidecar image, not a cached download"""
+        poster = metadata.get('poster')
+        if poster and Path(poster).exists() and self.cache_dir not in Path(poster).parents:
+            return poster
+        return None
 
     def download_poster(self, url, movie_title):
         """Download and cache a poster image"""
@@ -350,25 +748,30 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
         # Download and save the poster if it doesn't exist
         if not poster_path.exists():
             try:
-                response = requests.get(url, stream=True)
-                response.raise_for_status()
-                
-                with open(poster_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        
-                return str(poster_path)
+                from . import network
+                return network.download('images', url, poster_path, stats=self._fetch_stats,
+                                        token=self._fetch_token)
             except Exception as e:
                 print(f"Error downloading poster for {movie_title}: {e}")
                 return None
-        
+
+        if self._fetch_stats:
+            self._fetch_stats.cache_hit()
         return str(poster_path)
 
-    def download_person_image(self, url, person_name, role):
-        """Download and cache a person's image"""
+    def download_person_image(self, url, person_name, role, refresh=True):
+        """Download and cache a person's image
+
+        Downloads for a refresh count in its stats and stop when it is
+        cancelled, the detail page passes refresh=False.
+        """
+        stats, token = (self._fetch_stats, self._fetch_token) if refresh else (None, None)
         if not url:
             return None
-            
+        # Images from sidecars and the cache are already local files
+        if not url.startswith(('http://', 'https://')) and os.path.isfile(url):
+            return url
+
         # Create a safe filename from the person's name
         safe_name = "".join(c for c in person_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
         image_filename = f"{safe_name}.jpg"
@@ -379,38 +782,53 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
         
         # Use cached image if it exists
         if image_path.exists():
+            if stats:
+                stats.cache_hit()
             return str(image_path)
         
         # Download and cache the image if it doesn't exist
         try:
+            from . import network
             headers = {
                 'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:136.0) Gecko/20100101 Firefox/136.0'
             }
-            response = requests.get(url, headers=headers, stream=True)
-            response.raise_for_status()
-            
-            with open(image_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            
-            return str(image_path)
+            return network.download('images', url, image_path, stats=stats,
+                                    token=token, headers=headers, timeout=10)
+        except Cancelled:
+            raise
         except Exception as e:
             print(f"Error downloading {role} image for {person_name}: {e}")
             return None
 
-    def _fetch_movie_metadata(self, imdb, movie, progress_dialog):
-        """Fetch metadata for a single movie"""
+    def _fetch_movie_metadata(self, imdb, movie, progress_dialog, force=False):
+        """Fetch metadata for a single movie
+
+        Returns False if the movie already had metadata and was skipped,
+        and None if the lookup failed before IMDb gave an answer.
+        """
         try:
-            # Skip if movie already has metadata
-            if movie.get('metadata', {}).get('title'):
-                return
+            # Skip if movie already has metadata, unless forced
+            if not force and is_matched(movie.get('metadata', {})):
+                return False
                 
-            # Search for movie
-            # Clean movie title by removing common piracy markers and release years
-            cleaned_title = re.sub(r'(?i)[\._]?(720p|1080p|2160p|HDTV|BR?Rip|BluRay|WEB[-._ ]?DL|WEBRip|HDRip|DVDRip|x\.?264|x\.?265|XviD|[-._ ]YIFY|RARBG|\[.*?\]|\(.*?\)).*$', '', movie['title'])
-            cleaned_title = cleaned_title.replace('.', ' ').strip()
-            search_results = imdb.search_movie(cleaned_title)
-            if search_results:
+            # Search for movie by the title part of the release name
+            release = release_info(movie)
+            cleaned_title = release['title']
+            # A title tag in the file beats the release name
+            if movie.get('metadata', {}).get('source') == 'embedded':
+                cleaned_title = movie['metadata']['title']
+            if not force and self.negative_cache.should_skip('imdb-movie', cleaned_title):
+                return False
+            # The offline title index answers without a search request,
+            # only the detail page of the match is fetched
+            movie_id = self.title_index.lookup(cleaned_title, release.get('year'))
+            # A failed search raises, only an answered one is a miss
+            search_results = [{'movieID': movie_id}] if movie_id else imdb.search_movie(cleaned_title)
+            if not search_results:
+                self.negative_cache.record_miss('imdb-movie', cleaned_title,
+                                                "no IMDb title scored 70 or more", movie['path'])
+            else:
+                self.negative_cache.record_hit('imdb-movie', cleaned_title)
                 # Get first matching result
                 first_result = search_results[0]
                 movie_id = first_result.getID() if hasattr(first_result, 'getID') else first_result.get('movieID')
@@ -428,14 +846,20 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
                         'cast': [p['name'] for p in movie_data.get('cast', [])[:5]],
                         'genres': movie_data.get('genres', []),
                         'type': 'movie',
+                        'imdb_id': movie_id,
                         'cast_images': {},
                         'director_images': {},
                         'cast_bios': {},
                         'director_bios': {}
                     }
+                    freshness.stamp(metadata, freshness.CLASSES['movie'])
                     
-                    # Download poster if available
-                    if movie_data.get('full-size cover url'):
+                    # Download poster if available, a local poster image
+                    # next to the video is kept
+                    local_poster = self._local_poster(movie.get('metadata', {}))
+                    if local_poster:
+                        metadata['poster'] = local_poster
+                    elif movie_data.get('full-size cover url'):
                         poster_path = self.download_poster(
                             movie_data['full-size cover url'],
                             movie['title']
@@ -451,7 +875,7 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
                                 progress_dialog, 
                                 _("Fetching info for: {}").format(cast_member)
                             )
-                            wiki_data = self.wikipedia.search_person(cast_member)
+                            wiki_data = self._search_person_wikipedia(cast_member, movie['path'], force)
                             
                             if wiki_data and wiki_data.get('image_url'):
                                 # Use Wikipedia data
@@ -467,7 +891,7 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
                             elif self.settings.get_boolean('use-imdb'):
                                 # Fall back to IMDb data for cast member
                                 try:
-                                    cast_search = imdb.search_person(cast_member)
+                                    cast_search = self._search_person_imdb(imdb, cast_member, movie['path'], force)
                                     if cast_search and len(cast_search) > 0:
                                         # Get first result's ID directly from dictionary
                                         person_id = cast_search[0]['personID']
@@ -483,6 +907,8 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
                                                     metadata['cast_images'][cast_member] = image_path
                                             if person_data.get('bio'):
                                                 metadata['cast_bios'][cast_member] = person_data['bio']
+                                except Cancelled:
+                                    raise
                                 except Exception as e:
                                     print(f"Error fetching IMDb data for {cast_member}: {e}")
 
@@ -492,7 +918,7 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
                                 progress_dialog, 
                                 _("Fetching info for: {}").format(director)
                             )
-                            wiki_data = self.wikipedia.search_person(director)
+                            wiki_data = self._search_person_wikipedia(director, movie['path'], force)
                             
                             if wiki_data and wiki_data.get('image_url'):
                                 # Use Wikipedia data
@@ -507,7 +933,7 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
                             elif self.settings.get_boolean('use-imdb'):
                                 # Fall back to IMDb data for director
                                 try:
-                                    director_search = imdb.search_person(director)
+                                    director_search = self._search_person_imdb(imdb, director, movie['path'], force)
                                     if director_search:
                                         person_id = director_search[0].getID()
                                         person_data = imdb.get_person(person_id)
@@ -521,121 +947,565 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
                                                 metadata['director_images'][director] = image_path
                                         if person_data.get('bio'):
                                             metadata['director_bios'][director] = person_data['bio']
+                                except Cancelled:
+                                    raise
                                 except Exception as e:
                                     print(f"Error fetching IMDb data for {director}: {e}")
 
+                    # Providers swallow their own errors, don't store what a
+                    # cancel cut short
+                    if self._fetch_token:
+                        self._fetch_token.raise_if_cancelled()
+
                     # Update metadata
-                    self.update_metadata(movie['path'], metadata)
+                    self.dispatcher.call(self.update_metadata, movie['path'], metadata)
                     
+        except Cancelled:
+            pass
         except Exception as e:
             print(f"Error processing movie {movie['title']}: {e}")
+            if self._fetch_stats:
+                self._fetch_stats.error('movies')
+            return None
+        return True
 
-    def _fetch_show_metadata(self, tvmaze, show_name, seasons, progress_dialog):
-        """Fetch metadata for a single TV show and its episodes"""
+    def _search_person_wikipedia(self, name, item, force=False, stats=None, token=None):
+        """Wikipedia person lookup that remembers names without an article
+
+        stats and token default to those of the running refresh.
+        """
+        if not force and self.negative_cache.should_skip('wikipedia-person', name):
+            return None
         try:
-            # Search for show
-            search_results = tvmaze.search_tv(show_name)
-            if search_results:
+            wiki_data = self.wikipedia.search_person(name, stats=stats, token=token)
+        except Cancelled:
+            raise
+        except Exception as e:
+            # A failed request says nothing about the person, don't remember it
+            print(f"Error searching Wikipedia for {name}: {e}")
+            return None
+        if wiki_data:
+            self.negative_cache.record_hit('wikipedia-person', name)
+        else:
+            self.negative_cache.record_miss('wikipedia-person', name,
+                                            "no Wikipedia article about this person", item)
+        return wiki_data
+
+    def _search_person_imdb(self, imdb, name, item, force=False):
+        """IMDb person search that remembers names without a match"""
+        if not force and self.negative_cache.should_skip('imdb-person', name):
+            return None
+        results = imdb.search_person(name)
+        if results:
+            self.negative_cache.record_hit('imdb-person', name)
+        else:
+            self.negative_cache.record_miss('imdb-person', name,
+                                            "no IMDb person scored 70 or more", item)
+        return results
+
+    def _fetch_show_metadata(self, tvmaze, show_name, seasons, progress_dialog,
+                             show_metadata=None, force=False):
+        """Fetch metadata for a single TV show and its episodes
+
+        Unless forced, only episodes without metadata are looked up, and a
+        show that was fetched before is not searched again. Returns False
+        if everything was already complete and the show was skipped, and
+        None if a TVMaze request failed.
+        """
+        def is_missing(episode):
+            return (force or not is_matched(episode.get('metadata', {}))) and \
+                   self._get_episode_number(episode)
+
+        # Folders that aren't numbered seasons have no TVMaze season
+        missing = {season_num: [e for e in episodes if is_missing(e)]
+                   for season_num, episodes in seasons.items() if str(season_num).isdigit()}
+        missing = {season_num: episodes for season_num, episodes in missing.items() if episodes}
+        show_metadata = show_metadata or {}
+        if not force and show_metadata.get('title') and not missing:
+            return False
+
+        try:
+            show_id = None if force else show_metadata.get('tvmaze_id')
+            if show_id is None:
+                # Search for show, an empty list means TVMaze had no match
+                # and None that the search itself failed
+                if not force and self.negative_cache.should_skip('tvmaze-show', show_name):
+                    return False
+                search_results = tvmaze.search_tv(show_name)
+                if search_results == []:
+                    self.negative_cache.record_miss('tvmaze-show', show_name,
+                                                    "no TVMaze results", f"show:{show_name}")
+                if search_results is None:
+                    return None
+                if not search_results:
+                    return True
+                self.negative_cache.record_hit('tvmaze-show', show_name)
+
                 # Get first result
                 show_id = search_results[0]['seriesID']
-                
+
+            if not force and show_metadata.get('source') == 'nfo':
+                # A tvshow.nfo wins over TVMaze, only the id is needed
+                # to look up the missing episodes
+                if show_metadata.get('tvmaze_id') != show_id:
+                    show_metadata = dict(show_metadata, tvmaze_id=show_id)
+                    self.dispatcher.call(self.update_metadata, f"show:{show_name}", show_metadata)
+            elif show_id != show_metadata.get('tvmaze_id') or force:
                 # Get detailed show info
                 show_data = tvmaze.get_show(show_id)
-                if show_data:
-                    # Build show metadata
-                    show_metadata = {
-                        'title': show_data['title'],
-                        'year': show_data['year'],
-                        'rating': show_data['rating'],
-                        'plot': show_data['plot outline'],
-                        'genres': show_data['genres'],
-                        'type': 'show',
-                        'cast': [actor['name'] for actor in show_data.get('cast', [])],
-                        'poster': None
-                    }
-                    
-                    # Download show poster
-                    if show_data.get('full-size cover url'):
-                        poster_path = self.download_poster(
-                            show_data['full-size cover url'],
-                            show_name
+                if not show_data:
+                    return None
+
+                # Build show metadata
+                show_metadata_before = show_metadata
+                show_metadata = {
+                    'title': show_data['title'],
+                    'year': show_data['year'],
+                    'rating': show_data['rating'],
+                    'plot': show_data['plot outline'],
+                    'genres': show_data['genres'],
+                    'type': 'show',
+                    'cast': [actor['name'] for actor in show_data.get('cast', [])],
+                    'poster': None,
+                    'tvmaze_id': show_id
+                }
+                freshness.stamp(show_metadata, freshness.CLASSES['show'])
+                
+                # Download show poster, unless there is one in the show folder
+                local_poster = self._local_poster(show_metadata_before)
+                if local_poster:
+                    show_metadata['poster'] = local_poster
+                elif show_data.get('full-size cover url'):
+                    poster_path = self.download_poster(
+                        show_data['full-size cover url'],
+                        show_name
+                    )
+                    if poster_path:
+                        show_metadata['poster'] = poster_path
+                
+                # Store show metadata
+                show_key = f"show:{show_name}"
+                self.dispatcher.call(self.update_metadata, show_key, show_metadata)
+            
+            # Get episodes data for each season that has missing episodes
+            answered = True
+            for season_num, episodes in missing.items():
+                season_data = tvmaze.get_season(show_id, int(season_num))
+                if season_data is None:
+                    answered = False
+                elif season_data['episodes']:
+                    for episode in episodes:
+                        episode_number = self._get_episode_number(episode)
+                        # Find matching episode
+                        tvmaze_episode = next(
+                            (e for e in season_data['episodes'] 
+                             if e['episode_number'] == episode_number),
+                            None
                         )
-                        if poster_path:
-                            show_metadata['poster'] = poster_path
-                    
-                    # Store show metadata
-                    show_key = f"show:{show_name}"
-                    self.metadata[show_key] = show_metadata
-                    
-                    # Get episodes data for each season
-                    for season_num, episodes in seasons.items():
-                        season_data = tvmaze.get_season(show_id, int(season_num))
-                        if season_data and season_data['episodes']:
-                            for episode in episodes:
-                                episode_number = self._get_episode_number(episode['title'])
-                                if episode_number:
-                                    # Find matching episode
-                                    tvmaze_episode = next(
-                                        (e for e in season_data['episodes'] 
-                                         if e['episode_number'] == episode_number),
-                                        None
-                                    )
-                                    
-                                    if tvmaze_episode:
-                                        episode_metadata = {
-                                            'title': tvmaze_episode['title'],
-                                            'plot': tvmaze_episode['plot'],
-                                            'air_date': tvmaze_episode['air_date'],
-                                            'rating': tvmaze_episode['rating'],
-                                            'season': season_num,
-                                            'episode': episode_number,
-                                            'is_episode': True,
-                                            'show_name': show_name,
-                                            'type': 'episode'
-                                        }
-                                        
-                                        # Update episode metadata
-                                        self.update_metadata(episode['path'], episode_metadata)
-                    
-                    # Save all metadata
-                    self.save_metadata()
+                        
+                        if tvmaze_episode:
+                            episode_metadata = {
+                                'title': tvmaze_episode['title'],
+                                'plot': tvmaze_episode['plot'],
+                                'air_date': tvmaze_episode['air_date'],
+                                'rating': tvmaze_episode['rating'],
+                                'season': season_num,
+                                'episode': episode_number,
+                                'is_episode': True,
+                                'show_name': show_name,
+                                'type': 'episode'
+                            }
+                            
+                            # Update episode metadata
+                            self.dispatcher.call(self.update_metadata, episode['path'], episode_metadata)
+            
+            # Save all metadata
+            self.dispatcher.call(self.save_metadata)
+            if not answered:
+                return None
                                     
+        except Cancelled:
+            pass
         except Exception as e:
             print(f"Error processing show {show_name}: {e}")
+            if self._fetch_stats:
+                self._fetch_stats.error('shows')
+            return None
+        return True
 
     def _finish_metadata_refresh(self):
-        """Complete the metadata refresh by updating UI"""
+        """Complete the metadata refresh, the cards were already updated
+        key by key as the metadata came in"""
         try:
-            # Load updated data
-            self.load_library()
-            
-            # Force layout update by switching views
-            while self.navigation_view.get_visible_page() and \
-                  self.navigation_view.get_visible_page().get_tag() != "main":
-                self.navigation_view.pop()
-            self.navigation_view.pop_to_tag("main")
-            self.populate_ui()
+            self.save_snapshot()
             
             # Show success toast
             toast = Adw.Toast.new(_("Successfully fetched metadata"))
             toast.set_timeout(3)
             self.toast_overlay.add_toast(toast)
             
-            # Force a redraw
-            self.queue_draw()
-            
         except Exception as e:
             print(f"Error refreshing UI: {e}")
         return False
 
     def _update_progress_safely(self, progress_dialog, text):
-        """Update progress dialog text safely from any thread"""
-        if not progress_dialog or not progress_dialog.get_visible():
+        """Update progress dialog text safely from any thread
+
+        Updates are coalesced, only the latest text is shown a few
+        times per second.
+        """
+        if not progress_dialog:
+            return
+        self.dispatcher.progress(progress_dialog, self._set_progress_text, progress_dialog, text)
+
+    def _set_progress_text(self, progress_dialog, text):
+        if progress_dialog.get_visible():
+            progress_dialog.set_body(text)
+
+    def _schedule_refresh_priorities(self, *args):
+        """Recompute the refresh order once scrolling or navigation settles"""
+        if self._refresh_running and self._priorities_timeout_id is None:
+            self._priorities_timeout_id = GLib.timeout_add(100, self._update_refresh_priorities)
+
+    def _update_refresh_priorities(self):
+        """Tell the refresh queue what the user is looking at
+
+        The open detail or episodes page goes first, then the cards on
+        screen, then the next screenful of the visible grid.
+        """
+        self._priorities_timeout_id = None
+        if not self._refresh_running:
+            return False
+
+        priorities = {}
+        if self.view_stack.get_visible_child_name() == 'shows':
+            cards = {f"show:{name}": card for name, card in self._show_cards.items()}
+            box = self.shows_box
+        else:
+            cards = self._movie_cards
+            box = self.movies_box
+
+        viewport = box.get_ancestor(Gtk.ScrolledWindow) or self.view_stack
+        height = viewport.get_height()
+        for key, card in cards.items():
+            if not card.get_mapped():
+                continue
+            ok, x, y = card.translate_coordinates(viewport, 0, 0)
+            if not ok or y + card.get_height() < 0:
+                continue
+            if y <= height:
+                priorities[key] = PRIORITY_VISIBLE
+            elif y <= 2 * height:
+                priorities[key] = PRIORITY_NEXT_SCREEN
+
+        page = self.navigation_view.get_visible_page()
+        child = page.get_child() if page else None
+        if isinstance(child, EpisodesUI):
+            priorities[f"show:{child.show_name}"] = PRIORITY_OPEN
+        elif isinstance(child, HomeTheaterItem):
+            priorities[child.video_path] = PRIORITY_OPEN
+
+        self.refresh_queue.set_priorities(priorities)
+        return False
+
+    def _checkpoint_refresh(self, key, signature, answered=True):
+        """Record a finished refresh item, saved with the next metadata write
+
+        An item whose lookup failed is done for this refresh but not
+        recorded in the scan index, so the next delta refresh tries again.
+        """
+        self.refresh_queue.mark_done(key)
+        if answered:
+            self.scan_index.update(key, signature=signature,
+                                   matched=is_matched(self.metadata.get(key, {})))
+        self._schedule_save()
+
+    def _end_refresh(self):
+        self._refresh_running = False
+        self._schedule_revalidation()
+        if self.refresh_queue.finished:
+            self.refresh_queue.clear()
+        else:
+            # Interrupted, keep the checkpoint so the next refresh resumes
+            self.save_metadata()
+
+    def _schedule_revalidation(self, delay=60):
+        """Revalidate expired metadata once the app has been idle a while
+
+        Cached metadata is always shown as is. Expired field classes are
+        refreshed in the background, at most revalidate-budget requests
+        per session, and never while a refresh is running.
+        """
+        if self._revalidate_source is None and self._revalidate_token is None:
+            self._revalidate_source = GLib.timeout_add_seconds(
+                delay, self._start_revalidation, priority=GLib.PRIORITY_LOW)
+
+    def _start_revalidation(self):
+        self._revalidate_source = None
+        budget = self.settings.get_int('revalidate-budget') - self._revalidate_spent
+        if budget <= 0 or not self.library_loaded:
+            return False
+        if self._refresh_running:
+            # _end_refresh schedules the next attempt
+            return False
+
+        use_imdb = self.settings.get_boolean('use-imdb')
+        use_tvmaze = self.settings.get_boolean('use-tvmaze')
+        keys = ([movie['path'] for movie in self.movies] if use_imdb else []) + \
+               ([f"show:{name}" for name in self.shows] if use_tvmaze else [])
+        due = freshness.due_items(self.metadata, keys)
+        if not due:
+            return False
+
+        metadata = {key: dict(self.metadata[key]) for key, _ in due}
+        shows = dict(self.shows)
+        token = CancellationToken()
+        self._revalidate_token = token
+
+        def revalidate_async():
+            from .fetchstats import FetchStats
+            stats = FetchStats(len(due))
+
+            def over_budget():
+                return stats.total_requests >= budget
+
+            try:
+                # These clients are only used by this run, the shared
+                # Wikipedia client gets the stats and token per call
+                imdb = self.get_imdb() if use_imdb else None
+                tvmaze = self.get_tvmaze() if use_tvmaze else None
+                for client in (imdb, tvmaze):
+                    if client:
+                        client.stats = stats
+                        client.token = token
+
+                # The budget is checked between items and within them
+                for key, classes in due:
+                    if token.cancelled or over_budget():
+                        break
+                    try:
+                        if key.startswith("show:"):
+                            name = key[len("show:"):]
+                            if name in shows:
+                                self._revalidate_show(tvmaze, name, shows[name], metadata[key],
+                                                      classes, over_budget)
+                        else:
+                            self._revalidate_movie(imdb, key, metadata[key], classes,
+                                                   over_budget, stats, token)
+                    except Cancelled:
+                        raise
+                    except Exception as e:
+                        # The item keeps its old fields and stays due
+                        print(f"Error revalidating {key}: {e}")
+                    stats.item_done()
+            except Cancelled:
+                pass
+            except Exception as e:
+                print(f"Error revalidating metadata: {e}")
+            finally:
+                self.dispatcher.call(self._end_revalidation, stats.total_requests)
+
+        thread = threading.Thread(target=revalidate_async)
+        thread.daemon = True
+        thread.start()
+        return False
+
+    def _end_revalidation(self, requests):
+        self._revalidate_token = None
+        self._revalidate_spent += requests
+
+    def _merge_revalidated(self, key, changes):
+        """Apply refreshed fields to the entry as it is now, so edits made
+        while the revalidation ran are kept"""
+        current = self.metadata.get(key)
+        if not current:
+            return
+        merged = dict(current)
+        for field, value in changes.items():
+            if isinstance(value, dict) and isinstance(current.get(field), dict):
+                # fetched_at and the bios only gain entries
+                merged[field] = {**current[field], **value}
+            else:
+                merged[field] = value
+        if merged != current:
+            self.update_metadata(key, merged)
+
+    def _revalidated(self, key, changes, classes):
+        """Hand the refreshed fields of an entry, stamped, to the main loop"""
+        if self._revalidate_token:
+            self._revalidate_token.raise_if_cancelled()
+        # Stamp even when nothing was found, the item waits for its next TTL
+        stamped = {}
+        freshness.stamp(stamped, classes)
+        changes['fetched_at'] = stamped['fetched_at']
+        self.dispatcher.call(self._merge_revalidated, key, changes)
+
+    def _revalidate_movie(self, imdb, path, metadata, classes, over_budget, stats, token):
+        """Refresh the expired field classes of one movie
+
+        metadata is a copy from when the run started, only the refreshed
+        fields are sent back.
+        """
+        changes = {}
+        imdb_id = metadata.get('imdb_id')
+        if not imdb_id:
+            results = imdb.search_movie(metadata['title'])
+            imdb_id = results[0]['movieID'] if results else None
+
+        if imdb_id and ('ratings' in classes or 'details' in classes):
+            movie_data = imdb.get_movie(imdb_id)
+            if movie_data:
+                changes['imdb_id'] = imdb_id
+                changes['rating'] = movie_data.get('rating', metadata.get('rating'))
+                if 'details' in classes:
+                    changes['genres'] = movie_data.get('genres') or metadata.get('genres', [])
+                    changes['director'] = [p['name'] for p in movie_data.get('director', [])] or metadata.get('director', [])
+                    changes['cast'] = [p['name'] for p in movie_data.get('cast', [])[:5]] or metadata.get('cast', [])
+
+        if 'people' in classes and self.wikipedia:
+            complete = True
+            for field, names in (('cast_bios', changes.get('cast', metadata.get('cast', []))),
+                                 ('director_bios', changes.get('director', metadata.get('director', [])))):
+                bios = {}
+                for name in names:
+                    if over_budget():
+                        complete = False
+                        break
+                    wiki_data = self._search_person_wikipedia(name, path, stats=stats, token=token)
+                    if wiki_data and wiki_data.get('description'):
+                        bios[name] = wiki_data['description']
+                changes[field] = bios
+            if not complete:
+                # The bios found so far are kept, the rest stays due
+                classes = [name for name in classes if name != 'people']
+
+        self._revalidated(path, changes, classes)
+
+    def _revalidate_show(self, tvmaze, show_name, seasons, metadata, classes, over_budget):
+        """Refresh the expired field classes of a show and its episodes"""
+        changes = {}
+        show_id = metadata.get('tvmaze_id')
+        if not show_id:
+            results = tvmaze.search_tv(metadata['title'])
+            show_id = results[0]['seriesID'] if results else None
+        if not show_id:
+            self._revalidated(f"show:{show_name}", changes, classes)
+            return
+
+        changes['tvmaze_id'] = show_id
+        if 'ratings' in classes or 'details' in classes:
+            show_data = tvmaze.get_show(show_id)
+            if show_data:
+                changes['rating'] = show_data.get('rating', metadata.get('rating'))
+                if 'details' in classes:
+                    changes['genres'] = show_data.get('genres') or metadata.get('genres', [])
+                    changes['cast'] = [actor['name'] for actor in show_data.get('cast', [])] or metadata.get('cast', [])
+
+        updates = []
+        if 'episodes' in classes:
+            complete = True
+            for season_num, episodes in seasons.items():
+                # Folders that aren't numbered seasons have no TVMaze season
+                if not str(season_num).isdigit():
+                    continue
+                if over_budget():
+                    complete = False
+                    break
+                season_data = tvmaze.get_season(show_id, int(season_num))
+                if season_data is None:
+                    complete = False
+                    continue
+                by_number = {e['episode_number']: e for e in season_data['episodes']}
+                for episode in episodes:
+                    current = episode.get('metadata', {})
+                    tvmaze_episode = by_number.get(self._get_episode_number(episode))
+                    if not is_matched(current) or not tvmaze_episode:
+                        continue
+                    episode_changes = {field: tvmaze_episode[field]
+                                       for field in freshness.FIELDS['episodes']
+                                       if field in tvmaze_episode and current.get(field) != tvmaze_episode[field]}
+                    if episode_changes:
+                        updates.append((episode['path'], episode_changes))
+            if not complete:
+                # The seasons that were fetched are applied, the rest stays due
+                classes = [name for name in classes if name != 'episodes']
+
+        if self._revalidate_token:
+            self._revalidate_token.raise_if_cancelled()
+        for path, episode_changes in updates:
+            self.dispatcher.call(self._merge_revalidated, path, episode_changes)
+        self._revalidated(f"show:{show_name}", changes, classes)
+
+    def on_force_fetch_metadata(self, action, param):
+        self.on_fetch_metadata(action, param, force=True)
+
+    def on_fetch_metadata(self, action, param, force=False, delta=False):
+        """Refresh metadata for the library
+
+        Args:
+            force: refetch items that already have metadata
+            delta: only look at items that are new, renamed or changed since
+                the last refresh, or that lost their metadata. Used for the
+                automatic refresh at startup.
+        """
+        if not self.library_loaded:
+            toast = Adw.Toast.new(_("The library is still loading"))
+            toast.set_timeout(3)
+            self.toast_overlay.add_toast(toast)
+            return
+        if self._refresh_running:
+            if not delta:
+                toast = Adw.Toast.new(_("A refresh is already running"))
+                toast.set_timeout(3)
+                self.toast_overlay.add_toast(toast)
             return
-        GLib.idle_add(lambda: progress_dialog.set_body(text) if progress_dialog.get_visible() else None)
 
-    def on_fetch_metadata(self, action, param):
         settings = Gio.Settings.new('space.koyu.hometheater')
+
+        # A refresh takes over from a running background revalidation
+        if self._revalidate_token:
+            self._revalidate_token.cancel()
+
+        # The worker only sees a copy of the library and a flag, all UI
+        # and model changes go through the dispatcher
+        movies = {movie['path']: movie for movie in self.movies}
+        shows = dict(self.shows)
+        metadata = dict(self.metadata)
+
+        use_imdb = settings.get_boolean('use-imdb')
+        use_tvmaze = settings.get_boolean('use-tvmaze')
+        signatures = {}
+        if use_imdb:
+            signatures.update((path, movie_signature(path)) for path in movies)
+        if use_tvmaze:
+            signatures.update((f"show:{name}", show_signature(seasons)) for name, seasons in shows.items())
+        self.scan_index.prune(list(movies) + [f"show:{name}" for name in shows])
+
+        jobs = list(signatures)
+        if delta:
+            # Items without a match wait for their re-check in the
+            # negative cache
+            waiting = self.negative_cache.waiting_items(('imdb-movie', 'tvmaze-show'))
+            jobs = [key for key in jobs
+                    if key not in waiting and
+                    self.scan_index.needs_refresh(key, signatures[key],
+                                                  is_matched(metadata.get(key, {})))]
+
+        # Pick up an interrupted refresh where it stopped, a forced
+        # refresh always starts over
+        queue = self.refresh_queue
+        if not force and queue.load():
+            queue.keep_only(set(signatures))
+            force = queue.force
+            toast = Adw.Toast.new(_("Resuming the previous refresh"))
+            toast.set_timeout(3)
+            self.toast_overlay.add_toast(toast)
+        elif delta and not jobs:
+            # Nothing changed since the last refresh
+            return
+        else:
+            queue.start(jobs, force)
+        pending = queue.pending()
         
         # Create progress dialog
         progress_dialog = Adw.MessageDialog.new(
@@ -643,52 +1513,112 @@ class HomeTheaterWindow(Adw.ApplicationWindow):
             _("Fetching Metadata"),
             _("Please wait while fetching metadata...")
         )
+        # Keep the library usable, what the user browses to is fetched first
+        progress_dialog.set_modal(False)
         
+        content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         spinner = Gtk.Spinner()
         spinner.start()
         spinner.set_size_request(32, 32)
         spinner.set_margin_top(12)
-        spinner.set_margin_bottom(12)
-        progress_dialog.set_extra_child(spinner)
+        content.append(spinner)
+
+        stats_label = Gtk.Label()
+        stats_label.add_css_class("dim-label")
+        stats_label.add_css_class("caption")
+        stats_label.add_css_class("numeric")
+        stats_label.set_justify(Gtk.Justification.CENTER)
+        stats_label.set_margin_bottom(12)
+        content.append(stats_label)
+
+        progress_dialog.set_extra_child(content)
         progress_dialog.add_response("cancel", _("Cancel"))
         progress_dialog.present()
+
+        token = CancellationToken()
+        self._refresh_running = True
+        self._update_refresh_priorities()
+
+        from .fetchstats import FetchStats
+        stats = FetchStats(len(pending))
+        self._fetch_stats = stats
+        self._fetch_token = token
+        stats_label.set_label(stats.format_progress())
+
+        def update_stats():
+            self.dispatcher.progress(stats_label, stats_label.set_label, stats.format_progress())
         
         def fetch_metadata_async():
             try:
-                # Process movies
-                if settings.get_boolean('use-imdb'):
-                    imdb = self.get_imdb()
-                    if imdb:
-                        for movie in self.movies:
-                            if not progress_dialog.get_visible():
-                                return
-                            self._update_progress_safely(progress_dialog, _("Processing movie: {}").format(movie['title']))
-                            self._fetch_movie_metadata(imdb, movie, progress_dialog)
-
-                # Process TV shows
-                if settings.get_boolean('use-tvmaze'):
-                    tvmaze = self.get_tvmaze()
-                    if tvmaze:
-                        for show_name, seasons in self.shows.items():
-                            if not progress_dialog.get_visible():
-                                return
-                            self._update_progress_safely(progress_dialog, _("Processing show: {}").format(show_name))
-                            self._fetch_show_metadata(tvmaze, show_name, seasons, progress_dialog)
-
-                # Save all metadata
-                self.save_metadata()
-                
-                # Update UI on main thread
-                GLib.idle_add(self._finish_metadata_refresh)
-                GLib.idle_add(progress_dialog.close)
+                imdb = self.get_imdb() if use_imdb else None
+                tvmaze = self.get_tvmaze() if use_tvmaze else None
+                for client in (imdb, tvmaze, self.wikipedia):
+                    if client:
+                        client.stats = stats
+                        client.token = token
+
+                # Take the most urgent job each time, the UI re-ranks the
+                # queue while the refresh runs
+                attempted = set()
+                while not token.cancelled:
+                    key = queue.next_job(skip=attempted)
+                    if key is None:
+                        break
+                    attempted.add(key)
+
+                    if key.startswith("show:"):
+                        if not tvmaze:
+                            continue
+                        show_name = key[len("show:"):]
+                        self._update_progress_safely(progress_dialog, _("Processing show: {}").format(show_name))
+                        fetched = self._fetch_show_metadata(
+                            tvmaze, show_name, shows[show_name], progress_dialog,
+                            show_metadata=metadata.get(key), force=force)
+                    else:
+                        if not imdb:
+                            continue
+                        movie = movies[key]
+                        self._update_progress_safely(progress_dialog, _("Processing movie: {}").format(movie['title']))
+                        fetched = self._fetch_movie_metadata(imdb, movie, progress_dialog, force=force)
+
+                    # An item cut short by a cancel is not done
+                    if token.cancelled:
+                        return
+                    self.dispatcher.call(self._checkpoint_refresh, key, signatures[key],
+                                         fetched is not None)
+                    stats.item_done(skipped=fetched is False)
+                    update_stats()
+
+                if token.cancelled:
+                    return
+
+                # Save all metadata and update UI on main thread
+                self.dispatcher.call(self.save_metadata)
+                self.dispatcher.call(self._finish_metadata_refresh)
                 
+            except Cancelled:
+                pass
             except Exception as e:
-                GLib.idle_add(self._show_error_dialog, str(e))
+                stats.error('refresh')
+                self.dispatcher.call(self._show_error_dialog, str(e))
             finally:
-                GLib.idle_add(progress_dialog.close)
+                stats.write_summary(self.cache_dir / "fetch-runs.log", cancelled=token.cancelled)
+                if self.wikipedia:
+                    self.wikipedia.stats = None
+                    self.wikipedia.token = None
+                self._fetch_stats = None
+                self._fetch_token = None
+                self.dispatcher.call(self._end_refresh)
+                self.dispatcher.call(progress_dialog.close)
 
         # Handle dialog response
-        progress_dialog.connect("response", lambda d, r: d.close() if r == "cancel" else None)
+        def on_response(dialog, response):
+            token.cancel()
+            if response == "cancel":
+                dialog.close()
+
+        progress_dialog.connect("response", on_response)
+        progress_dialog.connect("close-request", lambda d: token.cancel() or False)
         
         # Start background thread
         thread = threading.Thread(target=fetch_metadata_async)
@@ -747,6 +1677,51 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
     def on_open_folder(self, action, param):
         subprocess.run(['xdg-open', str(self.videos_dir)])
 
+    def on_retry_lookup(self, action, param):
+        """Forget failed lookups for one item so the next refresh tries again"""
+        key = param.get_string()
+        self.negative_cache.clear_item(key)
+        # Also make the next automatic refresh pick the item up
+        self.scan_index.forget(key)
+        self.negative_cache.save()
+        self.scan_index.save()
+
+        toast = Adw.Toast.new(_("This item will be looked up again on the next refresh"))
+        toast.set_timeout(3)
+        self.toast_overlay.add_toast(toast)
+
+    def on_stall_report(self, action, param):
+        """Show the stall watchdog report, with an option to save it"""
+        if not self.watchdog:
+            return
+
+        dialog = Adw.MessageDialog.new(self, _("Stall Report"), None)
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_min_content_height(300)
+        scrolled.set_min_content_width(600)
+
+        text_view = Gtk.TextView()
+        text_view.set_editable(False)
+        text_view.set_monospace(True)
+        text_view.get_buffer().set_text(self.watchdog.report())
+
+        scrolled.set_child(text_view)
+        dialog.set_extra_child(scrolled)
+
+        dialog.add_response("close", _("Close"))
+        dialog.add_response("save", _("Save"))
+
+        def on_response(dialog, response):
+            if response == "save" and self.watchdog:
+                path = self.watchdog.dump(self.cache_dir / "stall-report.txt")
+                toast = Adw.Toast.new(_("Report saved to {}").format(path))
+                toast.set_timeout(3)
+                self.toast_overlay.add_toast(toast)
+
+        dialog.connect("response", on_response)
+        dialog.present()
+
     def populate_ui(self):
         """Populate the UI with movies and shows"""
         # Clear existing content
@@ -783,47 +1758,47 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
             return container
 
         # Handle empty movies state
+        self._movie_cards = {}
+        self._show_cards = {}
         if not self.movies:
             empty_movies = create_empty_view(_("No Movies Found"))
             self.movies_box.append(empty_movies)
         else:
-            # Add movies as before
             for movie in self.movies:
-                title = movie.get('metadata', {}).get('title', movie['title'])
-                card = self._create_poster_card(
-                    title,
-                    movie.get('metadata', {}),
-                    lambda _, m=movie: self.show_movie_details(m)
-                )
+                card = self._create_poster_card(*self._movie_card_args(movie))
                 self.movies_box.append(card)
+                self._movie_cards[movie['path']] = card
 
         # Handle empty shows state
         if not self.shows:
             empty_shows = create_empty_view(_("No TV Shows Found"))
             self.shows_box.append(empty_shows)
         else:
-            # Add TV shows as before
             for show_name, seasons in self.shows.items():
-                show_key = f"show:{show_name}"
-                show_metadata = self.metadata.get(show_key, {})
-                if not show_metadata:
-                    first_season = next(iter(seasons.values()))
-                    first_episode = first_season[0]
-                    show_metadata = first_episode.get('metadata', {})
-                
                 card = self._create_poster_card(
-                    show_name,
-                    show_metadata,
-                    lambda _, s=show_name, seas=seasons: self.show_episodes(s, seas),
-                    is_show=True
-                )
+                    *self._show_card_args(show_name, seasons, self.metadata))
                 self.shows_box.append(card)
+                self._show_cards[show_name] = card
 
     def show_movie_details(self, movie):
         """Show movie details in a new navigation page"""
         # Create item view using template
         item = HomeTheaterItem(window=self, movie_data=movie)
+        self.fill_movie_details(item, movie)
+        metadata = movie.get('metadata', {})
         
+        # Create and push navigation page
+        page = Adw.NavigationPage(
+            title=metadata.get('title', movie['title']),
+            child=item
+        )
+        # Use unique tag based on movie path
+        page_tag = f"movie_details_{movie['path']}"
+        page.set_tag(page_tag)
+        self.navigation_view.push(page)
+
+    def fill_movie_details(self, item, movie):
+        """Fill (or refill) a detail page from the movie's metadata"""
         # Load metadata
         metadata = movie.get('metadata', {})
         item.update_metadata(
@@ -833,42 +1808,60 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
             genres=metadata.get('genres', [])
         )
         
-        # Set video path for playback
-        item.video_path = movie['path']
+        # Set video path for playback, the preferred one of its versions
+        item.video_path = choose_version(
+            movie, highest=self.settings.get_string('preferred-version') == 'highest')
         
         # Set poster if available
         if 'poster' in metadata and Path(metadata['poster']).exists():
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(metadata['poster'], 100, 150)
-            item.set_poster(pixbuf)
+            self._run_in_background(
+                lambda: GdkPixbuf.Pixbuf.new_from_file_at_size(metadata['poster'], 100, 150),
+                item.set_poster)
         
-        # Load cast and crew
+        # Load cast and crew with placeholders, the images are resolved
+        # and decoded in the background and filled in as they arrive
         item.clear_cast()
         for cast_member in metadata.get('cast', []):
-            image_path = self.download_person_image(
-                metadata.get('cast_images', {}).get(cast_member),
-                cast_member,
-                'cast'
-            )
-            item.add_cast_member(cast_member, image_path)
+            person = item.add_cast_member(cast_member, None)
+            self._load_person_image_async(
+                person, metadata.get('cast_images', {}).get(cast_member), 'cast')
         
         item.clear_directors()
         for director in metadata.get('director', []):
-            image_path = self.download_person_image(
-                metadata.get('director_images', {}).get(director),
-                director,
-                'directors'
-            )
-            item.add_director(director, image_path)
-        
-        # Create and push navigation page
-        page = Adw.NavigationPage(
-            title=metadata.get('title', movie['title']),
-            child=item
-        )
-        # Use unique tag based on movie path
-        page_tag = f"movie_details_{movie['path']}"
-        page.set_tag(page_tag)
-        self.navigation_view.push(page)
+            person = item.add_director(director, None)
+            self._load_person_image_async(
+                person, metadata.get('director_images', {}).get(director), 'directors')
+
+    def _run_in_background(self, work, on_done):
+        """Run work() on the image pool and pass a non-None result to
+        on_done() on the main thread"""
+        def deliver(future):
+            try:
+                result = future.result()
+            except Cancelled:
+                return False
+            except Exception as e:
+                print(f"Error loading image: {e}")
+                return False
+            if result is not None:
+                on_done(result)
+            return False
+
+        future = self._image_executor.submit(work)
+        future.add_done_callback(lambda f: self.dispatcher.call(deliver, f))
+
+    def _load_person_image_async(self, person, url, role):
+        """Download (if needed) and decode a cast or crew image off the main thread"""
+        size = person.avatar.size
+
+        def resolve():
+            # Not part of a running refresh, its cancel and stats don't apply
+            image_path = self.download_person_image(url, person.get_name(), role, refresh=False)
+            if image_path:
+                return GdkPixbuf.Pixbuf.new_from_file_at_scale(image_path, size, size, False)
+            return None
+
+        self._run_in_background(resolve, person.set_pixbuf)
 
     def edit_metadata(self, movie, key, current_value):
         dialog = Adw.MessageDialog(
@@ -971,6 +1964,7 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
             title (str, optional): Title to display. Defaults to None.
             show_metadata (dict, optional): Show metadata for episodes. Defaults to None.
         """
+        from .player import HomeTheaterPlayer
         player = HomeTheaterPlayer(self, path, title, show_metadata)
         player.present()
 
@@ -994,15 +1988,9 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
         
         return clean_title(file_title) == clean_title(imdb_title)
 
-    def _get_episode_number(self, filename):
-        """Extract episode number from filename"""
-        try:
-            match = re.search(r'[Ss]\d+[Ee](\d+)|[Ee](\d+)|(\d+)$', filename)
-            if match:
-                return int(match.group(1) or match.group(2) or match.group(3))
-        except Exception as e:
-            print(f"Error extracting episode number from {filename}: {e}")
-        return None
+    def _get_episode_number(self, episode):
+        """Episode number from the parsed file name of an episode entry"""
+        return episode_number(release_info(episode))
 
     def get_episode_metadata(self, episode_path):
         """Get combined show and episode metadata"""
@@ -1028,17 +2016,19 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
     def get_imdb(self):
         """Get IMDb API client"""
         try:
+            from .imdb import IMDb
             return IMDb()
         except Exception as e:
-            self._show_error_dialog(f"Failed to initialize IMDb client: {e}")
+            self.dispatcher.call(self._show_error_dialog, f"Failed to initialize IMDb client: {e}")
             return None
 
     def get_tvmaze(self):
         """Get TVMaze API client"""
         try:
+            from .tvmaze import TVMaze
             return TVMaze()
         except Exception as e:
-            self._show_error_dialog(f"Failed to initialize TVMaze client: {e}")
+            self.dispatcher.call(self._show_error_dialog, f"Failed to initialize TVMaze client: {e}")
             return None
 
     def on_view_sorting(self, action, param):
@@ -1088,6 +2078,8 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
         # Clear existing content
         self.movies_box.remove_all()
         self.shows_box.remove_all()
+        self._movie_cards = {}
+        self._show_cards = {}
         
         if not search_text:
             # If search is empty, show all items
@@ -1113,34 +2105,40 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
             
             if search_mode == 0:  # Title search
                 if search_text in show_name.lower():
-                    self._add_show_to_ui(show_name, seasons, show_metadata)
+                    self._add_show_to_ui(show_name, seasons)
             else:  # Genre search
                 genres = [g.lower() for g in show_metadata.get('genres', [])]
                 if any(search_text in genre for genre in genres):
-                    self._add_show_to_ui(show_name, seasons, show_metadata)
+                    self._add_show_to_ui(show_name, seasons)
 
     def _add_movie_to_ui(self, movie):
         """Helper to add a single movie to the UI"""
-        title = movie.get('metadata', {}).get('title', movie['title'])
-        card = self._create_poster_card(
-            title,
-            movie.get('metadata', {}),
-            lambda _, m=movie: self.show_movie_details(m)
-        )
+        card = self._create_poster_card(*self._movie_card_args(movie))
         self.movies_box.append(card)
+        self._movie_cards[movie['path']] = card
 
-    def _add_show_to_ui(self, show_name, seasons, metadata):
+    def _add_show_to_ui(self, show_name, seasons):
         """Helper to add a single show to the UI"""
-        card = self._create_poster_card(
-            show_name,
-            metadata,
-            lambda _, s=show_name, seas=seasons: self.show_episodes(s, seas),
-            is_show=True
-        )
+        card = self._create_poster_card(*self._show_card_args(show_name, seasons, self.metadata))
         self.shows_box.append(card)
+        self._show_cards[show_name] = card
 
-    def _create_poster_card(self, title, metadata, on_click, is_show=False):
-        """Create a poster card with hover effects"""
+    def _load_card_poster(self, image, poster):
+        """Decode a card poster once the grid has been drawn"""
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                poster, 200, 300, False)
+            image.set_pixbuf(pixbuf)
+            tracer.mark('first_poster')
+        except GLib.Error as e:
+            print(f"Error loading poster {poster}: {e}")
+        return False
+
+    def _create_poster_card(self, title, metadata, on_click, is_show=False, key=None):
+        """Create a poster card with hover effects
+
+        key is the item's metadata key, used by the card's context menu.
+        """
         overlay = Gtk.Overlay()
         overlay.add_css_class('poster-box')
         
@@ -1150,9 +2148,12 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
         # Add poster image
         poster = metadata.get('poster')
         if (poster and Path(poster).exists()):
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
-                poster, 200, 300, False)
-            image = Gtk.Picture.new_for_pixbuf(pixbuf)
+            # Decode after the first frame so startup doesn't scale with
+            # the number of posters
+            image = Gtk.Picture()
+            image.set_size_request(200, 300)
+            GLib.idle_add(self._load_card_poster, image, poster,
+                          priority=GLib.PRIORITY_LOW)
         else:
             icon_name = "video-television" if is_show else "image-missing"
             image = Gtk.Image.new_from_icon_name(icon_name)
@@ -1198,5 +2199,26 @@ SPDX-License-Identifier: GPL-3.0-or-later"""
         click = Gtk.GestureClick.new()
         click.connect('pressed', lambda g, n, x, y: on_click(None))
         box.add_controller(click)
+
+        if key:
+            menu_click = Gtk.GestureClick(button=Gdk.BUTTON_SECONDARY)
+            menu_click.connect('pressed', lambda g, n, x, y: self._show_card_menu(overlay, key, x, y))
+            overlay.add_controller(menu_click)
         
         return overlay
+
+    def _show_card_menu(self, card, key, x, y):
+        """Show the context menu of a poster card, built on demand"""
+        menu = Gio.Menu()
+        item = Gio.MenuItem.new(_("Retry Lookup"), None)
+        item.set_action_and_target_value('win.retry-lookup', GLib.Variant('s', key))
+        menu.append_item(item)
+
+        popover = Gtk.PopoverMenu.new_from_model(menu)
+        popover.set_parent(card)
+        rect = Gdk.Rectangle()
+        rect.x, rect.y, rect.width, rect.height = int(x), int(y), 1, 1
+        popover.set_pointing_to(rect)
+        popover.set_has_arrow(False)
+        popover.connect('closed', lambda p: GLib.idle_add(p.unparent))
+        popover.popup()